@@ -0,0 +1,79 @@
+"""Background writing checks for Keep Me Honest."""
+
+import threading
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class WritingCheckSignals(QObject):
+    """Signals emitted by a WritingCheckWorker."""
+    
+    # seq, issues, readability data, per-block results cache
+    finished = pyqtSignal(int, object, object, object)
+
+
+class WritingCheckWorker(QRunnable):
+    """Runs a writing check on a snapshot of the document in the thread pool."""
+    
+    def __init__(self, checker, seq, blocks, block_cache, cancel):
+        """
+        Initialize the worker.
+        
+        Args:
+            checker: WritingChecker used for the analysis
+            seq: Sequence number identifying this check
+            blocks: List of (position, text) tuples for each block
+            block_cache: (issues, readability counts) found for each block's
+                text by the previous check
+            cancel: threading.Event set when a newer check replaces this one
+        """
+        super().__init__()
+        self.checker = checker
+        self.seq = seq
+        self.blocks = blocks
+        self.block_cache = block_cache
+        self.cancel = cancel
+        self.signals = WritingCheckSignals()
+        
+        # The pool deletes the worker once run() returns, so it may only be
+        # taken back from the pool before run() starts
+        self._start_lock = threading.Lock()
+        self._started = False
+    
+    def withdraw(self, pool):
+        """
+        Remove the worker from pool if it has not started running.
+        
+        Args:
+            pool: QThreadPool the worker was started on
+        """
+        with self._start_lock:
+            if not self._started:
+                pool.tryTake(self)
+    
+    def run(self):
+        """Check changed blocks and emit the combined results."""
+        with self._start_lock:
+            self._started = True
+        
+        # Check every changed block in one batch
+        missing = list(dict.fromkeys(
+            text for _, text in self.blocks if text not in self.block_cache
+        ))
+        results = self.checker.check_blocks(missing, self.cancel.is_set)
+        if results is None:
+            return  # Superseded; the newer check reports instead
+        block_cache = dict(zip(missing, results))
+        
+        issues = []
+        counts = []
+        for position, block_text in self.blocks:
+            result = block_cache.get(block_text)
+            if result is None:
+                result = block_cache[block_text] = self.block_cache[block_text]
+            block_issues, block_counts = result
+            issues.extend(issue.shifted(position) for issue in block_issues)
+            counts.append(block_counts)
+        
+        # Readability combines the per-block counts instead of rescanning the text
+        readability_data = self.checker.readability.analyze_blocks(counts)
+        self.signals.finished.emit(self.seq, issues, readability_data, block_cache)
@@ -0,0 +1,95 @@
+"""Background file loading, saving and printing for Keep Me Honest."""
+
+from PyQt5.QtCore import QObject, QRunnable, QFile, QIODevice, QSaveFile, QTextStream, pyqtSignal
+
+
+class FileSignals(QObject):
+    """Signals emitted by the file workers."""
+    
+    # filename, file contents
+    loaded = pyqtSignal(str, str)
+    # filename, document revision that was saved
+    saved = pyqtSignal(str, int)
+    # filename, error message
+    failed = pyqtSignal(str, str)
+
+
+class FileLoadWorker(QRunnable):
+    """Reads a UTF-8 text file in the thread pool."""
+    
+    def __init__(self, filename):
+        """
+        Initialize the worker.
+        
+        Args:
+            filename: Path of the file to read
+        """
+        super().__init__()
+        self.filename = filename
+        self.signals = FileSignals()
+    
+    def run(self):
+        """Read the file and emit its contents."""
+        file = QFile(self.filename)
+        if not file.open(QIODevice.ReadOnly | QIODevice.Text):
+            self.signals.failed.emit(self.filename, file.errorString())
+            return
+        stream = QTextStream(file)
+        stream.setCodec('UTF-8')
+        content = stream.readAll()
+        file.close()
+        self.signals.loaded.emit(self.filename, content)
+
+
+class FileSaveWorker(QRunnable):
+    """Writes already-serialized document data to disk in the thread pool."""
+    
+    def __init__(self, filename, data, revision):
+        """
+        Initialize the worker.
+        
+        Args:
+            filename: Path of the file to write
+            data: Encoded document contents
+            revision: Document revision the data was taken from
+        """
+        super().__init__()
+        self.filename = filename
+        self.data = data
+        self.revision = revision
+        self.signals = FileSignals()
+    
+    def run(self):
+        """Write the data atomically and report the outcome."""
+        # QSaveFile writes to a temporary file and renames it on commit
+        file = QSaveFile(self.filename)
+        if file.open(QIODevice.WriteOnly):
+            file.write(self.data)
+            if file.commit():
+                self.signals.saved.emit(self.filename, self.revision)
+                return
+        self.signals.failed.emit(self.filename, file.errorString())
+
+
+class DocumentPrinter(QObject):
+    """Paginates and prints a document snapshot on the thread it is moved to."""
+    
+    # the job that finished
+    finished = pyqtSignal(object)
+    
+    def __init__(self, document, printer):
+        """
+        Initialize the printer job.
+        
+        Args:
+            document: Parentless copy of the document, moved to the same thread
+            printer: Configured QPrinter to print to
+        """
+        super().__init__()
+        self.document = document
+        self.printer = printer
+    
+    def run(self):
+        """Print the document and report completion."""
+        self.document.print_(self.printer)
+        self.finished.emit(self)
@@ -1,22 +1,119 @@
 """Font management and favorites system."""
 
-import json
 import os
-from PyQt5.QtWidgets import QComboBox, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QListWidget, QFontDialog, QMessageBox
-from PyQt5.QtGui import QFont, QFontDatabase
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication, QComboBox, QStyledItemDelegate, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QListWidget, QFontDialog, QMessageBox
+from PyQt5.QtGui import QFont, QFontDatabase, QStandardItem, QStandardItemModel
+from PyQt5.QtCore import Qt, QTimer, QObject, QThread, QThreadPool, pyqtSignal
+from .file_worker import FileSaveWorker
+
+try:
+    # Use orjson's C parser when it's installed
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+    _json_loads = json.loads
+    
+    def _json_dumps(obj):
+        """Serialize obj to UTF-8 encoded JSON, as orjson.dumps does."""
+        return json.dumps(obj).encode('utf-8')
+
+SETTINGS_FILE = os.path.expanduser('~/.word_processor_settings.json')
+
+
+class FontEnumerator(QObject):
+    """Queries the font database for installed families off the GUI thread."""
+    
+    finished = pyqtSignal(list)
+    
+    def run(self):
+        """Enumerate families, skipping hidden system fonts."""
+        font_db = QFontDatabase()
+        self.finished.emit([f for f in font_db.families() if not f.startswith('.')])
+
+
+class FontPreviewDelegate(QStyledItemDelegate):
+    """Renders each family in its own font, building the QFont only when painted."""
+    
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        family = index.data(Qt.UserRole)
+        if family:
+            option.font = CustomFontComboBox.preview_font(family)
 
 
 class CustomFontComboBox(QComboBox):
     """Font selector with favorites support."""
     
+    # Installed families and their preview fonts, shared across instances
+    _families_cache = None
+    _font_cache = {}
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_window = parent
         self.favorites = []
+        self._name_to_index = {}
+        # Family last set or picked; the list may not contain it until fonts load
+        self._current_family = ""
+        self._font_thread = None
+        self._font_enumerator = None
+        # Set when the font database changes under a running enumeration
+        self._families_stale = False
         self.currentIndexChanged.connect(self.on_font_changed)
         self.setEditable(False)
         self.setMaxVisibleItems(20)
+        self.setItemDelegate(FontPreviewDelegate(self))
+        # Fonts installed or removed while running invalidate the cached list
+        QApplication.instance().fontDatabaseChanged.connect(self.on_font_database_changed)
+    
+    def start_font_enumeration(self):
+        """Load installed families in a worker thread, rebuilding the list when done."""
+        if self._font_thread is not None and self._font_thread.isRunning():
+            return
+        
+        self._font_thread = QThread(self)
+        self._font_enumerator = FontEnumerator()
+        self._font_enumerator.moveToThread(self._font_thread)
+        self._font_thread.started.connect(self._font_enumerator.run)
+        self._font_enumerator.finished.connect(self.on_families_loaded)
+        self._font_enumerator.finished.connect(self._font_thread.quit)
+        self._font_thread.finished.connect(self._font_enumerator.deleteLater)
+        self._font_thread.start()
+    
+    def on_families_loaded(self, families):
+        """Cache the enumerated families and show them."""
+        if self._families_stale:
+            # The font database changed while enumerating; query it again
+            self._families_stale = False
+            self._font_thread.quit()
+            self._font_thread.wait()
+            self.start_font_enumeration()
+            return
+        CustomFontComboBox._families_cache = families
+        self.update_font_list()
+    
+    @classmethod
+    def preview_font(cls, family):
+        """Return the preview font for a family, creating it on first use."""
+        font = cls._font_cache.get(family)
+        if font is None:
+            font = cls._font_cache[family] = QFont(family)
+        return font
+    
+    @classmethod
+    def invalidate_font_cache(cls):
+        """Forget cached families so the next rebuild re-queries the font database."""
+        cls._families_cache = None
+        cls._font_cache = {}
+    
+    def on_font_database_changed(self):
+        """Re-query the installed families after the font database changes."""
+        self.invalidate_font_cache()
+        if self._font_thread is not None and self._font_thread.isRunning():
+            self._families_stale = True
+        self.update_font_list()
     
     def set_favorites(self, favorites):
         """Set and display favorite fonts."""
@@ -25,45 +122,63 @@ class CustomFontComboBox(QComboBox):
     
     def update_font_list(self):
         """Rebuild font list with favorites at top."""
-        current_text = self.currentText()
-        if current_text.startswith('★ '):
-            current_text = current_text[2:]
-        if current_text == "─────────────":
-            current_text = ""
+        # Not currentData(): while loading, that is whatever row setModel() picked
+        current_family = self._current_family
         
         self.blockSignals(True)
-        self.clear()
+        
+        # Until the worker delivers the installed families only favorites are shown
+        families = self._families_cache
+        if families is None:
+            self.start_font_enumeration()
+            families = []
+        
+        favorite_set = set(self.favorites)
+        other_families = [f for f in families if f not in favorite_set]
+        total = len(self.favorites) + (1 if self.favorites else 0) + len(other_families)
+        
+        # Build the new model offline, sized up front, and install it in one step
+        model = QStandardItemModel(total, 1, self)
+        self._name_to_index = {}
+        row = 0
         
         if self.favorites:
             for fav in self.favorites:
-                self.addItem(f"★ {fav}", fav)
-                self.setItemData(self.count() - 1, QFont(fav), Qt.FontRole)
-            
-            self.addItem("─────────────", "")
-            separator_index = self.count() - 1
+                self._name_to_index[fav] = row
+                model.setItem(row, self._make_item(f"★ {fav}", fav))
+                row += 1
             
-            model = self.model()
-            item = model.item(separator_index)
-            if item:
-                item.setEnabled(False)
+            separator = self._make_item("─────────────", "")
+            separator.setEnabled(False)
+            model.setItem(row, separator)
+            row += 1
         
-        font_db = QFontDatabase()
-        for family in font_db.families():
-            if not family.startswith('.') and family not in self.favorites:
-                self.addItem(family, family)
-                self.setItemData(self.count() - 1, QFont(family), Qt.FontRole)
+        for family in other_families:
+            self._name_to_index[family] = row
+            model.setItem(row, self._make_item(family, family))
+            row += 1
+        
+        self.setModel(model)
         
-        if current_text:
-            for i in range(self.count()):
-                if self.itemData(i) == current_text:
-                    self.setCurrentIndex(i)
-                    break
+        if current_family:
+            index = self._name_to_index.get(current_family)
+            if index is not None:
+                self.setCurrentIndex(index)
         
         self.blockSignals(False)
     
+    @staticmethod
+    def _make_item(text, family):
+        """Create a combo row displaying text with the family as its data."""
+        item = QStandardItem(text)
+        item.setData(family, Qt.UserRole)
+        return item
+    
     def on_font_changed(self, index):
         """Handle font selection change."""
         font_name = self.itemData(index)
+        if font_name:
+            self._current_family = font_name
         if font_name and self.parent_window:
             self.parent_window.change_font(QFont(font_name))
     
@@ -76,11 +191,10 @@ class CustomFontComboBox(QComboBox):
     
     def setCurrentFont(self, font):
         """Set current font by name."""
-        font_name = font.family()
-        for i in range(self.count()):
-            if self.itemData(i) == font_name:
-                self.setCurrentIndex(i)
-                break
+        self._current_family = font.family()
+        index = self._name_to_index.get(self._current_family)
+        if index is not None:
+            self.setCurrentIndex(index)
     
     def add_to_favorites(self, font_name):
         """Add font to favorites."""
@@ -172,25 +286,79 @@ class FavoriteFontsDialog(QDialog):
 class FontSettingsManager:
     """Manages font preferences and persistence."""
     
+    # Delay before pending favorites are written to disk (ms)
+    SAVE_DELAY = 500
+    
     def __init__(self):
-        self.settings_file = os.path.expanduser('~/.word_processor_settings.json')
+        self.settings_file = SETTINGS_FILE
+        self._pending = None
+        self._last_saved = None
+        
+        # Delayed saves are written one at a time off the GUI thread
+        self._write_pool = QThreadPool()
+        self._write_pool.setMaxThreadCount(1)
+        
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SAVE_DELAY)
+        self._save_timer.timeout.connect(self.flush_in_background)
     
     def load_favorites(self):
         """Load favorite fonts from settings file."""
         if os.path.exists(self.settings_file):
             try:
-                with open(self.settings_file, 'r') as f:
-                    settings = json.load(f)
-                    return settings.get('favorite_fonts', [])
+                with open(self.settings_file, 'rb') as f:
+                    settings = _json_loads(f.read())
+                    favorites = settings.get('favorite_fonts', [])
+                    self._last_saved = list(favorites)
+                    return favorites
             except:
                 return []
         return []
     
     def save_favorites(self, favorites):
-        """Save favorite fonts to settings file."""
+        """Schedule favorite fonts to be saved to the settings file."""
+        self._pending = list(favorites)
+        self._save_timer.start()
+    
+    def _take_pending(self):
+        """Return favorites that still need writing, or None if nothing changed."""
+        self._save_timer.stop()
+        favorites, self._pending = self._pending, None
+        if favorites is None or favorites == self._last_saved:
+            return None
+        return favorites
+    
+    def flush_in_background(self):
+        """Write pending favorites to disk in the write pool."""
+        favorites = self._take_pending()
+        if favorites is None:
+            return
+        
+        worker = FileSaveWorker(self.settings_file, _json_dumps({'favorite_fonts': favorites}), 0)
+        worker.signals.failed.connect(self.on_save_failed)
+        self._last_saved = favorites
+        self._write_pool.start(worker)
+    
+    def on_save_failed(self, filename, error):
+        """Report a background write that failed and allow it to be retried."""
+        self._last_saved = None
+        print(f"Could not save favorites: {error}")
+    
+    def flush(self):
+        """Write pending favorites to disk now, after any background write."""
+        self._write_pool.waitForDone()
+        favorites = self._take_pending()
+        if favorites is None:
+            return
+        
+        # Write to a temporary file first so a failed write can't corrupt settings
         settings = {'favorite_fonts': favorites}
+        temp_file = self.settings_file + '.tmp'
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(settings, f)
+            with open(temp_file, 'wb') as f:
+                f.write(_json_dumps(settings))
+            os.replace(temp_file, self.settings_file)
+            self._last_saved = favorites
         except Exception as e:
             print(f"Could not save favorites: {e}")
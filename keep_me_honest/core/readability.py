@@ -1,21 +1,60 @@
 """Readability analysis for Keep Me Honest."""
 
+import bisect
+import functools
 import re
-from typing import Dict, Tuple
+from typing import Dict, List, NamedTuple, Tuple
+
+
+class BlockCounts(NamedTuple):
+    """Readability counts for one block of text, combined by analyze_blocks()."""
+    
+    characters: int
+    words: int
+    # Characters in the words themselves, leaving out whitespace
+    word_characters: int
+    complex_words: int
+    # Vowel groups, before the document-wide silent-e adjustment
+    vowel_groups: int
+    ends_with_e: bool
+    # Whether the block contains a sentence terminator at all
+    terminated: bool
+    # Whether text precedes the first terminator and follows the last one;
+    # these pieces may join sentences in neighbouring blocks
+    head: bool
+    tail: bool
+    # Sentences lying wholly between the first and last terminators
+    inner_sentences: int
 
 
 class ReadabilityAnalyzer:
     """Analyzes text readability and provides metrics."""
     
-    # Grade levels with descriptors
+    # Grade levels with descriptors, each from its lower bound up
     GRADE_LEVELS = {
-        'Elementary': (0, 6),
-        'Middle School': (6, 9),
-        'High School': (9, 13),
-        'College': (13, 16),
-        'Graduate': (16, float('inf'))
+        'Elementary': 0,
+        'Middle School': 6,
+        'High School': 9,
+        'College': 13,
+        'Graduate': 16
     }
     
+    # Lower bounds of every level after the first, for a bisect lookup
+    _GRADE_BOUNDS = list(GRADE_LEVELS.values())[1:]
+    _GRADE_NAMES = list(GRADE_LEVELS)
+    
+    # Flesch Reading Ease descriptions, each from its lower bound up
+    _FLESCH_BOUNDS = [30, 50, 60, 70, 80, 90]
+    _FLESCH_NAMES = [
+        'Very Difficult', 'Difficult', 'Fairly Difficult', 'Standard',
+        'Fairly Easy', 'Easy', 'Very Easy'
+    ]
+    
+    SENTENCE_END = re.compile(r'[.!?]+')
+    # The non-blank part of each piece of text between sentence terminators
+    SENTENCE_PIECE = re.compile(r'[^.!?\s][^.!?]*')
+    VOWEL_GROUP = re.compile(r'[aeiouy]+')
+    
     def __init__(self):
         pass
     
@@ -24,21 +63,68 @@ class ReadabilityAnalyzer:
         Analyze text readability.
         Returns dict with various metrics.
         """
-        if not text or len(text.strip()) == 0:
-            return self._empty_analysis()
+        return self.analyze_blocks([self.block_counts(text)])
+    
+    def block_counts(self, text: str) -> BlockCounts:
+        """Count the parts of a block's readability that add up across blocks."""
+        word_list = text.split()
+        lowered = text.lower()
         
-        sentences = self._count_sentences(text)
-        words = self._count_words(text)
-        syllables = self._count_syllables(text)
-        characters = len(text)
+        # Count non-blank pieces rather than building a list of them
+        first_end = self.SENTENCE_END.search(text)
+        if first_end is None:
+            head = tail = bool(text) and not text.isspace()
+            inner_sentences = 0
+        else:
+            head = first_end.start() > 0 and not text[:first_end.start()].isspace()
+            tail = text.rstrip()[-1] not in '.!?'
+            inner_sentences = len(self.SENTENCE_PIECE.findall(text)) - head - tail
+        
+        return BlockCounts(
+            characters=len(text),
+            words=len(word_list),
+            word_characters=sum(map(len, word_list)),
+            complex_words=sum(map(_is_complex_word, word_list)),
+            vowel_groups=self._count_vowel_groups(lowered),
+            ends_with_e=lowered.endswith('e'),
+            terminated=first_end is not None,
+            head=head,
+            tail=tail,
+            inner_sentences=inner_sentences,
+        )
+    
+    def analyze_blocks(self, counts: List[BlockCounts]) -> Dict:
+        """
+        Analyze a document from the counts of its blocks, in order.
+        Gives the same result as analyze() on the blocks joined by newlines.
+        """
+        words = sum(block.words for block in counts)
+        if words == 0:
+            return self._empty_analysis()
         
-        if sentences == 0 or words == 0:
+        # A sentence left open at the end of a block continues into the next
+        sentences = 0
+        open_sentence = False
+        for block in counts:
+            if block.terminated:
+                sentences += (open_sentence or block.head) + block.inner_sentences
+                open_sentence = block.tail
+            else:
+                open_sentence = open_sentence or block.head
+        sentences += open_sentence
+        
+        if sentences == 0:
             return self._empty_analysis()
         
+        # Adjust for a silent e at the end of the text
+        syllables = max(1, sum(block.vowel_groups for block in counts) - counts[-1].ends_with_e)
+        characters = sum(block.characters for block in counts) + len(counts) - 1
+        complex_words = sum(block.complex_words for block in counts)
+        
         # Calculate various readability scores
-        flesch_kincaid_grade = self._flesch_kincaid_grade(sentences, words, syllables)
-        flesch_reading_ease = self._flesch_reading_ease(sentences, words, syllables)
-        gunning_fog = self._gunning_fog_index(sentences, words, text)
+        flesch_kincaid_grade, flesch_reading_ease, gunning_fog = self._scores(
+            sentences, words, syllables, complex_words
+        )
         
         # Average grade
         avg_grade = (flesch_kincaid_grade + gunning_fog) / 2
@@ -47,7 +133,7 @@ class ReadabilityAnalyzer:
         difficulty = self._get_difficulty_level(avg_grade)
         
         # Calculate other metrics
-        avg_word_length = words / len(text) * 100 if text else 0
+        avg_word_length = sum(block.word_characters for block in counts) / words
         avg_sentence_length = words / sentences if sentences > 0 else 0
         
         return {
@@ -80,117 +166,43 @@ class ReadabilityAnalyzer:
             'avg_sentence_length': 0,
         }
     
-    def _count_sentences(self, text: str) -> int:
-        """Count sentences (simplified)."""
-        sentences = re.split(r'[.!?]+', text)
-        return len([s for s in sentences if s.strip()])
-    
-    def _count_words(self, text: str) -> int:
-        """Count words."""
-        words = text.split()
-        return len(words)
-    
-    def _count_syllables(self, text: str) -> int:
-        """
-        Estimate syllable count using vowel groups.
-        Simplified but reasonably accurate.
-        """
-        text = text.lower()
-        syllable_count = 0
-        vowels = 'aeiouy'
-        previous_was_vowel = False
-        
-        for char in text:
-            is_vowel = char in vowels
-            if is_vowel and not previous_was_vowel:
-                syllable_count += 1
-            previous_was_vowel = is_vowel
-        
-        # Adjust for silent e
-        if text.endswith('e'):
-            syllable_count -= 1
-        
-        # Ensure at least 1 syllable
-        if syllable_count == 0:
-            syllable_count = 1
-        
-        return max(1, syllable_count)
-    
-    def _flesch_kincaid_grade(self, sentences: int, words: int, syllables: int) -> float:
-        """
-        Flesch-Kincaid Grade Level Formula.
-        0.39 * (words/sentences) + 11.8 * (syllables/words) - 15.59
-        """
-        if sentences == 0 or words == 0:
-            return 0
-        
-        grade = (0.39 * (words / sentences) + 
-                11.8 * (syllables / words) - 15.59)
-        
-        return max(0, grade)  # Don't go below 0
+    def _count_vowel_groups(self, text: str) -> int:
+        """Count runs of vowels in lowercase text."""
+        return len(self.VOWEL_GROUP.findall(text))
     
-    def _flesch_reading_ease(self, sentences: int, words: int, syllables: int) -> float:
+    def _scores(self, sentences: int, words: int, syllables: int,
+                complex_words: int) -> Tuple[float, float, float]:
         """
-        Flesch Reading Ease Score.
-        206.835 - 1.015 * (words/sentences) - 84.6 * (syllables/words)
-        Scores range from 0-100:
-        90-100: Very Easy, 80-89: Easy, 70-79: Fairly Easy,
-        60-69: Standard, 50-59: Fairly Difficult, 30-49: Difficult,
-        0-29: Very Difficult
+        Compute the three readability scores from shared ratios.
+        Sentence and word counts must be non-zero.
+        
+        Flesch-Kincaid Grade Level:
+            0.39 * (words/sentences) + 11.8 * (syllables/words) - 15.59
+        Flesch Reading Ease, 0-100 (see get_flesch_description):
+            206.835 - 1.015 * (words/sentences) - 84.6 * (syllables/words)
+        Gunning Fog Index, where complex words have 3+ syllables:
+            0.4 * ((words/sentences) + 100 * (complex_words/words))
+        
+        Returns:
+            Tuple of (Flesch-Kincaid grade, Flesch reading ease, Gunning Fog index)
         """
-        if sentences == 0 or words == 0:
-            return 0
+        words_per_sentence = words / sentences
+        syllables_per_word = syllables / words
         
-        score = (206.835 - 1.015 * (words / sentences) - 
-                84.6 * (syllables / words))
+        grade = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+        ease = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+        fog = 0.4 * (words_per_sentence + 100 * (complex_words / words))
         
-        return max(0, min(100, score))  # Clamp 0-100
-    
-    def _gunning_fog_index(self, sentences: int, words: int, text: str) -> float:
-        """
-        Gunning Fog Index.
-        0.4 * ((words/sentences) + 100 * (complex_words/words))
-        Complex words are those with 3+ syllables.
-        """
-        if sentences == 0 or words == 0:
-            return 0
-        
-        # Count complex words (3+ syllables)
-        word_list = text.split()
-        complex_words = 0
-        
-        for word in word_list:
-            if self._count_syllables(word) >= 3:
-                complex_words += 1
-        
-        index = (0.4 * ((words / sentences) + 
-                100 * (complex_words / words)))
-        
-        return max(0, index)
+        # Grades don't go below 0; ease is clamped to 0-100
+        return max(0, grade), max(0, min(100, ease)), max(0, fog)
     
     def _get_difficulty_level(self, grade: float) -> str:
         """Convert grade level to difficulty description."""
-        for level, (min_grade, max_grade) in self.GRADE_LEVELS.items():
-            if min_grade <= grade < max_grade:
-                return level
-        return 'Graduate'
+        return self._GRADE_NAMES[bisect.bisect_right(self._GRADE_BOUNDS, grade)]
     
     def get_flesch_description(self, score: float) -> str:
         """Get description of Flesch Reading Ease score."""
-        if score >= 90:
-            return "Very Easy"
-        elif score >= 80:
-            return "Easy"
-        elif score >= 70:
-            return "Fairly Easy"
-        elif score >= 60:
-            return "Standard"
-        elif score >= 50:
-            return "Fairly Difficult"
-        elif score >= 30:
-            return "Difficult"
-        else:
-            return "Very Difficult"
+        return self._FLESCH_NAMES[bisect.bisect_right(self._FLESCH_BOUNDS, score)]
     
     def format_analysis(self, analysis: Dict) -> str:
         """
@@ -225,4 +237,14 @@ class ReadabilityAnalyzer:
             f"{analysis['difficulty']} (Grade {analysis['avg_grade']}) | "
             f"{analysis['words']} words | "
             f"Flesch: {analysis['flesch_reading_ease']}"
-        )
\ No newline at end of file
+        )
+
+
+@functools.lru_cache(maxsize=65536)
+def _is_complex_word(word: str) -> bool:
+    """
+    Check a word for 3+ syllables, estimated as its vowel groups less a silent final e.
+    Words recur throughout a text, so this is cached, keyed on the word alone.
+    """
+    lowered = word.lower()
+    return len(ReadabilityAnalyzer.VOWEL_GROUP.findall(lowered)) - lowered.endswith('e') >= 3
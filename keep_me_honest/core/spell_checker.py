@@ -1,46 +1,214 @@
 """Spell checking functionality for the word processor."""
 
+import re
 import enchant
-from PyQt5.QtWidgets import QTextEdit, QMessageBox
+from PyQt5.QtWidgets import QTextEdit, QMessageBox, QToolTip
 from PyQt5.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QTextCursor
+from PyQt5.QtCore import QCoreApplication, QEvent, QObject, QThread, QTimer, pyqtSignal, pyqtSlot
+
+WORD_PATTERN = re.compile(r'\b[a-zA-Z]+\b')
+
+
+class SpellCheckWorker(QObject):
+    """Looks words up in its own Enchant dictionary off the GUI thread."""
+    
+    # {word: correctly spelled}
+    results_ready = pyqtSignal(object)
+    
+    def __init__(self, language):
+        super().__init__()
+        self.language = language
+        self._dictionary = None
+    
+    def dictionary(self):
+        """Return the worker's dictionary, loading it on the worker thread."""
+        if self._dictionary is None:
+            self._dictionary = enchant.Dict(self.language)
+        return self._dictionary
+    
+    @pyqtSlot(object)
+    def check_words(self, words):
+        """Check a batch of words and emit the results."""
+        check = self.dictionary().check
+        self.results_ready.emit({word: check(word) for word in words})
+    
+    @pyqtSlot(str)
+    def add_word(self, word):
+        """Accept a word the user added to the personal dictionary."""
+        self.dictionary().add_to_session(word)
 
 
 class SpellCheckHighlighter(QSyntaxHighlighter):
     """Highlights misspelled words with a wavy red underline."""
     
+    # Cached spellings kept before the cache is dropped (~1 MB of words)
+    WORD_CACHE_SIZE = 65536
+    
+    # Paragraphs remembered as free of misspellings before that set is dropped
+    CLEAN_BLOCK_CACHE_SIZE = 4096
+    
+    # Suggestion lists kept before that cache is dropped
+    SUGGESTION_CACHE_SIZE = 256
+    
+    # Longer words are taken to be identifiers or URLs when ignoring them
+    MAX_WORD_LENGTH = 24
+    
+    # Pause in typing before new words are sent to the worker (ms)
+    IDLE_DELAY = 400
+    
+    # Signals to the worker thread
+    words_requested = pyqtSignal(object)
+    word_added = pyqtSignal(str)
+    
     def __init__(self, document, language='en'):
         super().__init__(document)
+        # Used on the GUI thread for suggestions and the personal dictionary
         self.spell_checker = enchant.Dict(language)
         self.enabled = True
+        # Skip CamelCase, ALLCAPS and very long words, which are rarely prose
+        self.ignore_mixed_case = False
+        
+        # Spelling of every word looked up so far, and words awaiting the worker
+        self._known = {}
+        self._suggestions = {}
+        # Text of blocks whose every word is known to be spelled correctly
+        self._clean_blocks = set()
+        self._pending_words = set()
+        self._in_flight = set()
+        
+        # Restarted by every edit that meets unknown words, so lookups wait for a pause
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(self.IDLE_DELAY)
+        self._idle_timer.timeout.connect(self.request_pending_words)
         
         # Format for misspelled words - thicker wavy underline
         self.error_format = QTextCharFormat()
         self.error_format.setUnderlineColor(QColor(255, 0, 0))  # Bright red
         self.error_format.setUnderlineStyle(QTextCharFormat.WaveUnderline)
+        
+        self._thread = QThread(self)
+        self._worker = SpellCheckWorker(language)
+        self._worker.moveToThread(self._thread)
+        self.words_requested.connect(self._worker.check_words)
+        self.word_added.connect(self._worker.add_word)
+        self._worker.results_ready.connect(self.on_results_ready)
+        self._thread.finished.connect(self._worker.deleteLater)
+        self._thread.start()
+        QCoreApplication.instance().aboutToQuit.connect(self.stop)
+    
+    def stop(self):
+        """Stop the worker thread."""
+        self._thread.quit()
+        self._thread.wait()
     
     def set_enabled(self, enabled):
         """Enable or disable spell checking."""
         self.enabled = enabled
         self.rehighlight()
     
+    def set_ignore_mixed_case(self, ignore):
+        """Enable or disable skipping mixed-case and overlong words."""
+        self.ignore_mixed_case = ignore
+        self._clean_blocks.clear()  # Words skipped until now may be misspelled
+        self.rehighlight()
+    
+    def is_ignored(self, word):
+        """Check whether word is skipped without a dictionary lookup."""
+        if not self.ignore_mixed_case:
+            return False
+        rest = word[1:]
+        return rest != rest.lower() or len(word) > self.MAX_WORD_LENGTH
+    
     def highlightBlock(self, text):
-        """Check each word in the text block."""
-        if not self.enabled:
+        """Underline known misspellings and queue unknown words for the worker."""
+        if not self.enabled or text in self._clean_blocks:
             return
         
-        import re
-        for match in re.finditer(r'\b[a-zA-Z]+\b', text):
+        waiting = False
+        clean = True
+        for match in WORD_PATTERN.finditer(text):
             word = match.group()
-            if not self.spell_checker.check(word):
+            if self.ignore_mixed_case and self.is_ignored(word):
+                continue
+            correct = self._known.get(word)
+            if correct is None:
+                waiting = True
+                if word not in self._in_flight:
+                    self._pending_words.add(word)
+            elif not correct:
+                clean = False
                 self.setFormat(match.start(), len(word), self.error_format)
+        
+        if clean and not waiting:
+            # Words are only ever added to the dictionary, so this stays true
+            if len(self._clean_blocks) >= self.CLEAN_BLOCK_CACHE_SIZE:
+                self._clean_blocks.clear()
+            self._clean_blocks.add(text)
+        elif waiting and self._pending_words:
+            self._idle_timer.start()
+    
+    def request_pending_words(self):
+        """Send the words collected since the last batch to the worker."""
+        if not self._pending_words:
+            return
+        words, self._pending_words = self._pending_words, set()
+        self._in_flight |= words
+        self.words_requested.emit(words)
+    
+    def on_results_ready(self, results):
+        """Record the worker's answers and underline the misspellings found."""
+        if len(self._known) > self.WORD_CACHE_SIZE:
+            self._known.clear()
+        self._known.update(results)
+        self._in_flight.difference_update(results)
+        
+        # Blocks are found by their current text rather than remembered, since
+        # edits during the round trip renumber or free them. Words answered as
+        # correct need no repaint; those blocks were painted without underlines.
+        misspelled = {word for word, correct in results.items() if not correct}
+        document = self.document()
+        if not misspelled or document is None or not self.enabled:
+            return
+        block = document.begin()
+        while block.isValid():
+            if any(m.group() in misspelled for m in WORD_PATTERN.finditer(block.text())):
+                self.rehighlightBlock(block)
+            block = block.next()
     
     def add_to_dictionary(self, word):
         """Add word to personal dictionary."""
         self.spell_checker.add(word)
+        self._known[word] = True
+        self._suggestions.clear()  # The new word may now be suggested
+        self.word_added.emit(word)
+        self.rehighlight_word(word)
+    
+    def rehighlight_word(self, word):
+        """Rehighlight only the blocks that contain word."""
+        block = self.document().begin()
+        while block.isValid():
+            if word in block.text():
+                self.rehighlightBlock(block)
+            block = block.next()
+    
+    def is_misspelled(self, word):
+        """Check a single word, answering from the cache when possible."""
+        if self.is_ignored(word):
+            return False
+        correct = self._known.get(word)
+        if correct is None:
+            correct = self._known[word] = self.spell_checker.check(word)
+        return not correct
     
     def get_suggestions(self, word):
-        """Get spelling suggestions for a word."""
-        return self.spell_checker.suggest(word)
+        """Get spelling suggestions for a word, cached since Enchant's search is slow."""
+        suggestions = self._suggestions.get(word)
+        if suggestions is None:
+            if len(self._suggestions) >= self.SUGGESTION_CACHE_SIZE:
+                self._suggestions.clear()
+            suggestions = self._suggestions[word] = self.spell_checker.suggest(word)
+        return suggestions
 
 
 class SpellCheckTextEdit(QTextEdit):
@@ -54,6 +222,18 @@ class SpellCheckTextEdit(QTextEdit):
         """Set the spell checker instance."""
         self.spell_checker = spell_checker
     
+    def event(self, event):
+        """Show the tooltips of extra selections, which QTextEdit ignores."""
+        if event.type() == QEvent.ToolTip:
+            position = self.cursorForPosition(event.pos()).position()
+            for selection in self.extraSelections():
+                tooltip = selection.format.toolTip()
+                cursor = selection.cursor
+                if tooltip and cursor.selectionStart() <= position < cursor.selectionEnd():
+                    QToolTip.showText(event.globalPos(), tooltip, self)
+                    return True
+        return super().event(event)
+    
     def contextMenuEvent(self, event):
         """Override context menu to add spell check suggestions."""
         menu = self.createStandardContextMenu()
@@ -65,7 +245,7 @@ class SpellCheckTextEdit(QTextEdit):
         
         # Check if word is misspelled
         if self.spell_checker and word and self.spell_checker.enabled:
-            if not self.spell_checker.spell_checker.check(word):
+            if self.spell_checker.is_misspelled(word):
                 # Add suggestions
                 suggestions = self.spell_checker.get_suggestions(word)[:5]
                 
@@ -97,7 +277,6 @@ class SpellCheckTextEdit(QTextEdit):
         """Add word to personal dictionary."""
         if self.spell_checker:
             self.spell_checker.add_to_dictionary(word)
-            self.spell_checker.rehighlight()
             QMessageBox.information(
                 self, 'Dictionary Updated',
                 f'"{word}" has been added to your personal dictionary.'
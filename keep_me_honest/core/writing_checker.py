@@ -1,13 +1,65 @@
 """Writing quality checker for Keep Me Honest."""
 
+import functools
+import multiprocessing
+import os
 import re
-from typing import List, Tuple, Dict
-from .readability import ReadabilityAnalyzer
+from typing import Callable, List, Tuple, Dict
+from .readability import BlockCounts, ReadabilityAnalyzer
+
+
+@functools.lru_cache(maxsize=None)
+def _word_regex(word: str):
+    """Compile a case-insensitive whole-word pattern for word."""
+    return re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
+
+
+def _alternation_regex(words):
+    """
+    Compile one case-insensitive whole-word pattern matching any of words.
+    The alternative that matched is match.lastindex - 1.
+    """
+    alternatives = '|'.join('(' + re.escape(word) + ')' for word in words)
+    return re.compile(r'\b(?:' + alternatives + r')\b', re.IGNORECASE)
+
+
+def _lookahead_union(patterns):
+    """
+    Compile patterns into one case-insensitive scan in which matches of
+    different patterns may overlap. Each pattern sits in a lookahead, so
+    only patterns that cannot match at the same position should be joined.
+    
+    Returns:
+        Tuple of (regex, group number holding each pattern's match)
+    """
+    groups = []
+    group = 1
+    for pattern in patterns:
+        groups.append(group)
+        group += 1 + re.compile(pattern).groups
+    union = '|'.join('(?=(' + pattern + '))' for pattern in patterns)
+    return re.compile(union, re.IGNORECASE), groups
+
+
+@functools.lru_cache(maxsize=16)
+def _single_words_regex(words: Tuple[str, ...]):
+    """
+    Compile one alternation for a tuple of single words, or return None
+    if any entry is empty or has non-word characters. Matches of distinct
+    single words can never overlap, so one scan finds exactly what a scan
+    per word would.
+    """
+    if not words or not all(re.fullmatch(r'\w+', word) for word in words):
+        return None
+    return _alternation_regex(words)
 
 
 class WritingIssue:
     """Represents a writing issue found in text."""
     
+    # A long document yields thousands of issues; slots keep each one small
+    __slots__ = ('issue_type', 'start', 'end', 'text', 'suggestion')
+    
     def __init__(self, issue_type: str, start: int, end: int, text: str, suggestion: str = ""):
         self.issue_type = issue_type
         self.start = start
@@ -15,6 +67,11 @@ class WritingIssue:
         self.text = text
         self.suggestion = suggestion
     
+    def shifted(self, offset: int) -> 'WritingIssue':
+        """Return a copy of this issue moved by offset characters."""
+        return WritingIssue(self.issue_type, self.start + offset, self.end + offset,
+                            self.text, self.suggestion)
+    
     def __repr__(self):
         return f"WritingIssue({self.issue_type}, {self.start}-{self.end}, '{self.text}')"
 
@@ -22,6 +79,13 @@ class WritingIssue:
 class WritingChecker:
     """Analyzes text for various writing issues."""
     
+    # Below this many characters, process start-up and IPC cost more than checking
+    # (serial checking runs at roughly 750k characters a second)
+    PARALLEL_THRESHOLD = 256 * 1024
+    
+    # Most worker processes to start; each one re-imports the checker
+    MAX_POOL_SIZE = 4
+    
     # Passive voice patterns (simplified)
     PASSIVE_PATTERNS = [
         r'\b(am|is|are|was|were|be|been|being)\s+\w+ed\b',
@@ -64,6 +128,39 @@ class WritingChecker:
         ]
     }
     
+    # Phrases with simpler alternatives
+    SIMPLE_ALTERNATIVES = {
+        'at this point in time': 'now',
+        'in the event that': 'if',
+        'due to the fact that': 'because',
+        'in order to': 'to',
+        'for the purpose of': 'to',
+    }
+    
+    # -ly words that are not adverbs worth flagging
+    ADVERB_EXCEPTIONS = ['only', 'family', 'really', 'daily']
+    
+    # Patterns compiled once, with each word list folded into a single scan
+    # The passive patterns begin with different words, so they share one scan
+    _PASSIVE_RE, _PASSIVE_GROUPS = _lookahead_union(PASSIVE_PATTERNS)
+    _WEAK_WORDS_RE = _alternation_regex(WEAK_WORDS)
+    _JARGON_RE = _alternation_regex(list(JARGON))
+    _JARGON_SUGGESTIONS = list(JARGON.values())
+    _SIMPLE_ALTERNATIVES_RE = _alternation_regex(list(SIMPLE_ALTERNATIVES))
+    _SIMPLE_SUGGESTIONS = list(SIMPLE_ALTERNATIVES.values())
+    # The exceptions are rejected inside the scan, before a match is built
+    _ADVERB_RE = re.compile(
+        r'\b(?!(?:' + '|'.join(map(re.escape, ADVERB_EXCEPTIONS)) + r')\b)\w+ly\b',
+        re.IGNORECASE
+    )
+    _SENTENCE_END_RE = re.compile(r'[.!?]+')
+    _TOKEN_RE = re.compile(r'\S+')
+    _CONFUSED_RES = [
+        (re.compile(pattern, re.IGNORECASE), suggestion)
+        for patterns in CONFUSED_SYNONYMS.values()
+        for pattern, suggestion in patterns
+    ]
+    
     # Cinnamon words (overused words - user customizable)
     CINNAMON_WORDS = [
         'really', 'very', 'just', 'nice', 'good', 'bad', 'thing', 'stuff'
@@ -83,6 +180,7 @@ class WritingChecker:
         }
         self.cinnamon_words = self.CINNAMON_WORDS.copy()
         self.readability = ReadabilityAnalyzer()
+        self._pool = None
     
     def add_cinnamon_word(self, word: str):
         """Add a word to the cinnamon words list."""
@@ -104,6 +202,56 @@ class WritingChecker:
         Analyze text and return issues plus readability data.
         Returns: (issues, readability_dict)
         """
+        issues = self.check_block(text)
+        
+        # Get readability analysis
+        readability_data = self.readability.analyze(text)
+        
+        return issues, readability_data
+    
+    def check_blocks(self, texts: List[str],
+                     cancelled: Callable[[], bool] = None) -> List[Tuple[List[WritingIssue], BlockCounts]]:
+        """
+        Find writing issues and readability counts for several blocks of text.
+        Large batches are spread across a process pool.
+        cancelled, if given, is polled between blocks to stop early.
+        Returns: one (issues, readability counts) pair per block, in order,
+        or None if cancelled
+        """
+        if len(texts) < 2 or sum(len(t) for t in texts) < self.PARALLEL_THRESHOLD:
+            tasks = map(self._check_block_counts, texts)
+        else:
+            config = (self.enabled_checks, self.cinnamon_words)
+            chunksize = max(1, len(texts) // (4 * self._pool_size()))
+            tasks = self._get_pool().imap(
+                _check_block, [(config, text) for text in texts], chunksize
+            )
+        
+        results = []
+        for result in tasks:
+            if cancelled and cancelled():
+                return None
+            results.append(result)
+        return results
+    
+    def _check_block_counts(self, text: str) -> Tuple[List[WritingIssue], BlockCounts]:
+        """Find writing issues and readability counts for one block of text."""
+        return self.check_block(text), self.readability.block_counts(text)
+    
+    def _get_pool(self):
+        """Return the process pool, starting it on first use."""
+        if self._pool is None:
+            # Spawn rather than fork: the caller is a threaded Qt process
+            context = multiprocessing.get_context('spawn')
+            self._pool = context.Pool(self._pool_size())
+        return self._pool
+    
+    def _pool_size(self) -> int:
+        """Return how many worker processes the pool uses."""
+        return min(self.MAX_POOL_SIZE, os.cpu_count() or 1)
+    
+    def check_block(self, text: str) -> List[WritingIssue]:
+        """Find writing issues in a single block of text, sorted by position."""
         issues = []
         
         if self.enabled_checks['passive_voice']:
@@ -136,52 +284,67 @@ class WritingChecker:
         # Sort by position
         issues.sort(key=lambda x: x.start)
         
-        # Get readability analysis
-        readability_data = self.readability.analyze(text)
-        
-        return issues, readability_data
+        return issues
     
-    def get_readability_compact(self, text: str) -> str:
-        """Get compact readability analysis for selected text."""
-        analysis = self.readability.analyze(text)
+    def get_readability_compact(self, text: str, block_cache: Dict = None) -> str:
+        """
+        Get compact readability analysis for selected text.
+        Paragraphs whose (issues, readability counts) are in block_cache
+        reuse the counts instead of being scanned again.
+        """
+        block_cache = block_cache or {}
+        counts = []
+        # Selections separate paragraphs with U+2029
+        for block_text in text.split('\u2029'):
+            cached = block_cache.get(block_text)
+            counts.append(cached[1] if cached else self.readability.block_counts(block_text))
+        analysis = self.readability.analyze_blocks(counts)
         return self.readability.format_analysis_compact(analysis)
     
     def _check_passive_voice(self, text: str) -> List[WritingIssue]:
         """Detect passive voice constructions."""
         issues = []
-        for pattern in self.PASSIVE_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                issues.append(WritingIssue(
-                    'passive_voice',
-                    match.start(),
-                    match.end(),
-                    match.group(),
-                    'Consider using active voice instead'
-                ))
+        # Like a separate scan per pattern, a pattern's matches never overlap each other
+        resume = [0] * len(self._PASSIVE_GROUPS)
+        for match in self._PASSIVE_RE.finditer(text):
+            for index, group in enumerate(self._PASSIVE_GROUPS):
+                start, end = match.span(group)
+                if start != -1 and start >= resume[index]:
+                    resume[index] = end
+                    issues.append(WritingIssue(
+                        'passive_voice',
+                        start,
+                        end,
+                        text[start:end],
+                        'Consider using active voice instead'
+                    ))
         return issues
     
     def _check_weak_words(self, text: str) -> List[WritingIssue]:
         """Detect weak filler words."""
         issues = []
-        for word in self.WEAK_WORDS:
-            pattern = r'\b' + re.escape(word) + r'\b'
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                issues.append(WritingIssue(
-                    'weak_words',
-                    match.start(),
-                    match.end(),
-                    match.group(),
-                    f'Remove "{word}" or replace with stronger wording'
-                ))
+        for match in self._WEAK_WORDS_RE.finditer(text):
+            word = self.WEAK_WORDS[match.lastindex - 1]
+            issues.append(WritingIssue(
+                'weak_words',
+                match.start(),
+                match.end(),
+                match.group(),
+                f'Remove "{word}" or replace with stronger wording'
+            ))
         return issues
     
     def _check_long_sentences(self, text: str) -> List[WritingIssue]:
         """Detect sentences longer than 20 words."""
         issues = []
-        sentences = re.split(r'[.!?]+', text)
+        sentences = self._SENTENCE_END_RE.split(text)
         pos = 0
         
         for sentence in sentences:
+            # 21 words take at least 41 characters, so shorter sentences need no split
+            if len(sentence) <= 40:
+                pos += len(sentence) + 1
+                continue
             words = sentence.split()
             if len(words) > 20:
                 issues.append(WritingIssue(
@@ -198,99 +361,102 @@ class WritingChecker:
     def _check_jargon(self, text: str) -> List[WritingIssue]:
         """Detect jargon and complex words."""
         issues = []
-        for jargon_word, simple_word in self.JARGON.items():
-            pattern = r'\b' + re.escape(jargon_word) + r'\b'
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                issues.append(WritingIssue(
-                    'jargon',
-                    match.start(),
-                    match.end(),
-                    match.group(),
-                    f'Use "{simple_word}" instead'
-                ))
+        for match in self._JARGON_RE.finditer(text):
+            simple_word = self._JARGON_SUGGESTIONS[match.lastindex - 1]
+            issues.append(WritingIssue(
+                'jargon',
+                match.start(),
+                match.end(),
+                match.group(),
+                f'Use "{simple_word}" instead'
+            ))
         return issues
     
     def _check_adjectives_adverbs(self, text: str) -> List[WritingIssue]:
         """Detect excessive adjectives and adverbs ending in -ly."""
         issues = []
         # Find adverbs ending in -ly
-        pattern = r'\b\w+ly\b'
-        for match in re.finditer(pattern, text, re.IGNORECASE):
-            if match.group().lower() not in ['only', 'family', 'really', 'daily']:
-                issues.append(WritingIssue(
-                    'adjectives_adverbs',
-                    match.start(),
-                    match.end(),
-                    match.group(),
-                    'Consider removing or replacing this adverb'
-                ))
+        for match in self._ADVERB_RE.finditer(text):
+            issues.append(WritingIssue(
+                'adjectives_adverbs',
+                match.start(),
+                match.end(),
+                match.group(),
+                'Consider removing or replacing this adverb'
+            ))
         return issues
     
     def _check_simple_alternatives(self, text: str) -> List[WritingIssue]:
         """Suggest simpler alternatives for common phrases."""
-        alternatives = {
-            'at this point in time': 'now',
-            'in the event that': 'if',
-            'due to the fact that': 'because',
-            'in order to': 'to',
-            'for the purpose of': 'to',
-        }
-        
         issues = []
-        for phrase, simple in alternatives.items():
-            pattern = r'\b' + re.escape(phrase) + r'\b'
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                issues.append(WritingIssue(
-                    'simple_alternatives',
-                    match.start(),
-                    match.end(),
-                    match.group(),
-                    f'Replace with "{simple}"'
-                ))
+        for match in self._SIMPLE_ALTERNATIVES_RE.finditer(text):
+            simple = self._SIMPLE_SUGGESTIONS[match.lastindex - 1]
+            issues.append(WritingIssue(
+                'simple_alternatives',
+                match.start(),
+                match.end(),
+                match.group(),
+                f'Replace with "{simple}"'
+            ))
         return issues
     
     def _check_confused_synonyms(self, text: str) -> List[WritingIssue]:
         """Detect commonly confused word pairs."""
         issues = []
-        for pair, patterns in self.CONFUSED_SYNONYMS.items():
-            for pattern, suggestion in patterns:
-                for match in re.finditer(pattern, text, re.IGNORECASE):
-                    issues.append(WritingIssue(
-                        'confused_synonyms',
-                        match.start(),
-                        match.end(),
-                        match.group(),
-                        suggestion
-                    ))
+        for regex, suggestion in self._CONFUSED_RES:
+            for match in regex.finditer(text):
+                issues.append(WritingIssue(
+                    'confused_synonyms',
+                    match.start(),
+                    match.end(),
+                    match.group(),
+                    suggestion
+                ))
         return issues
     
     def _check_repeated_words(self, text: str) -> List[WritingIssue]:
         """Detect repeated words close together."""
         issues = []
-        words = text.split()
+        previous_start = previous_word = None
         
-        for i in range(len(words) - 1):
-            if words[i].lower() == words[i + 1].lower():
-                # Find position in original text
-                pos = text.lower().find(words[i].lower())
-                if pos >= 0:
-                    issues.append(WritingIssue(
-                        'repeated_words',
-                        pos,
-                        pos + len(words[i] + ' ' + words[i + 1]),
-                        f'{words[i]} {words[i + 1]}',
-                        'Remove the repeated word'
-                    ))
+        # Same tokens as text.split(), but with their positions
+        for match in self._TOKEN_RE.finditer(text):
+            word = match.group().lower()
+            if word == previous_word:
+                issues.append(WritingIssue(
+                    'repeated_words',
+                    previous_start,
+                    match.end(),
+                    text[previous_start:match.end()],
+                    'Remove the repeated word'
+                ))
+            previous_start, previous_word = match.start(), word
         
         return issues
     
     def _check_cinnamon_words(self, text: str) -> List[WritingIssue]:
         """Detect overused 'cinnamon' words."""
         issues = []
-        for word in self.cinnamon_words:
-            pattern = r'\b' + re.escape(word) + r'\b'
+        words = tuple(self.cinnamon_words)
+        regex = _single_words_regex(words)
+        if regex is not None:
+            counts = [0] * len(words)
+            for match in regex.finditer(text):
+                index = match.lastindex - 1
+                counts[index] += 1
+                issues.append(WritingIssue(
+                    'cinnamon_words',
+                    match.start(),
+                    match.end(),
+                    match.group(),
+                    f'Overused word (used {counts[index]} times)'
+                ))
+            return issues
+        
+        # Phrases may overlap one another, so they are scanned separately
+        for word in words:
             count = 0
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+            for match in _word_regex(word).finditer(text):
                 count += 1
                 issues.append(WritingIssue(
                     'cinnamon_words',
@@ -300,4 +466,13 @@ class WritingChecker:
                     f'Overused word (used {count} times)'
                 ))
         
-        return issues
\ No newline at end of file
+        return issues
+
+
+def _check_block(args) -> Tuple[List[WritingIssue], BlockCounts]:
+    """Check one block in a pool process using the caller's configuration."""
+    (enabled_checks, cinnamon_words), text = args
+    checker = WritingChecker()
+    checker.enabled_checks = enabled_checks
+    checker.cinnamon_words = cinnamon_words
+    return checker._check_block_counts(text)
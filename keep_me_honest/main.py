@@ -5,19 +5,21 @@ A word processor with writing analysis, spell checking, and readability metrics.
 
 import sys
 import os
+import threading
+from contextlib import contextmanager
+from functools import partial
 os.environ['QT_MAC_WANTS_LAYER'] = '1'
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QAction, QFileDialog, QMessageBox,
     QSpinBox, QToolBar, QColorDialog, QDoubleSpinBox, QLabel,
-    QMenu, QToolButton, QDialog
+    QMenu, QToolButton, QDialog, QProgressDialog, QActionGroup
 )
 from PyQt5.QtGui import (
     QFont, QTextCharFormat, QColor, QTextCursor,
     QTextListFormat, QTextBlockFormat
 )
-from PyQt5.QtCore import Qt, QTimer, QSize
-from PyQt5.QtPrintSupport import QPrintDialog, QPrinter, QPrintPreviewDialog
+from PyQt5.QtCore import Qt, QTimer, QElapsedTimer, QSize, QThread, QThreadPool
 
 # Import from organized structure
 try:
@@ -26,6 +28,8 @@ try:
     from keep_me_honest.core.font_manager import CustomFontComboBox, FavoriteFontsDialog, FontSettingsManager
     from keep_me_honest.ui.find_replace import FindReplaceDialog
     from keep_me_honest.core.writing_checker import WritingChecker
+    from keep_me_honest.core.check_worker import WritingCheckWorker
+    from keep_me_honest.core.file_worker import FileLoadWorker, FileSaveWorker, DocumentPrinter
     from keep_me_honest.ui.writing_checker_ui import WritingCheckerDock, WritingHighlighter
     from keep_me_honest.resources.icon_manager import IconManager, Icons
 except ImportError:
@@ -34,6 +38,8 @@ except ImportError:
     from core.font_manager import CustomFontComboBox, FavoriteFontsDialog, FontSettingsManager
     from ui.find_replace import FindReplaceDialog
     from core.writing_checker import WritingChecker
+    from core.check_worker import WritingCheckWorker
+    from core.file_worker import FileLoadWorker, FileSaveWorker, DocumentPrinter
     from ui.writing_checker_ui import WritingCheckerDock, WritingHighlighter
     from resources.icon_manager import IconManager, Icons
 
@@ -43,6 +49,102 @@ class KeepMeHonest(QMainWindow):
     
     VERSION = "1.0.0"
     
+    FILE_FILTER = 'Text Files (*.txt);;HTML Files (*.html);;All Files (*)'
+    
+    # Writing check debounce in ms: one ms per 50 characters within these
+    # bounds, and never deferred longer than CHECK_MAX_WAIT while typing
+    CHECK_DELAY_MIN = 150
+    CHECK_DELAY_MAX = 2000
+    CHECK_MAX_WAIT = 3000
+    
+    # Keyboard shortcuts by slot name, shared by menus and toolbars
+    SHORTCUTS = {
+        'new_file': 'Ctrl+N',
+        'open_file': 'Ctrl+O',
+        'save_file': 'Ctrl+S',
+        'save_file_as': 'Ctrl+Shift+S',
+        'print_document': 'Ctrl+P',
+        'close': 'Ctrl+Q',
+        'text_edit.undo': 'Ctrl+Z',
+        'text_edit.redo': 'Ctrl+Y',
+        'text_edit.cut': 'Ctrl+X',
+        'text_edit.copy': 'Ctrl+C',
+        'text_edit.paste': 'Ctrl+V',
+        'show_find_replace': 'Ctrl+F',
+        'toggle_bold': 'Ctrl+B',
+        'toggle_italic': 'Ctrl+I',
+        'toggle_underline': 'Ctrl+U',
+        'toggle_strikethrough': 'Ctrl+Shift+X',
+        'add_current_font_to_favorites': 'Ctrl+Shift+F',
+    }
+    
+    # Menu entries: (label, slot name); None adds a separator
+    FILE_MENU = [
+        ('New', 'new_file'),
+        ('Open...', 'open_file'),
+        ('Save', 'save_file'),
+        ('Save As...', 'save_file_as'),
+        None,
+        ('Print Preview...', 'print_preview'),
+        ('Print...', 'print_document'),
+        None,
+        ('Exit', 'close'),
+    ]
+    
+    EDIT_MENU = [
+        ('Undo', 'text_edit.undo'),
+        ('Redo', 'text_edit.redo'),
+        None,
+        ('Cut', 'text_edit.cut'),
+        ('Copy', 'text_edit.copy'),
+        ('Paste', 'text_edit.paste'),
+        None,
+        ('Find and Replace...', 'show_find_replace'),
+    ]
+    
+    FORMAT_MENU = [
+        ('Highlight Color...', 'change_highlight_color'),
+        None,
+    ]
+    
+    LIST_FONT_MENU = [
+        ('Bullet List', 'toggle_bullet_list'),
+        ('Numbered List', 'toggle_numbered_list'),
+        None,
+        ('Add Current Font to Favorites', 'add_current_font_to_favorites'),
+        ('Manage Favorite Fonts...', 'manage_favorites'),
+    ]
+    
+    # List style menu: (label, style); None adds a separator
+    LIST_STYLE_MENU = [
+        ('• Disc Bullets', QTextListFormat.ListDisc),
+        ('◦ Circle Bullets', QTextListFormat.ListCircle),
+        ('▪ Square Bullets', QTextListFormat.ListSquare),
+        None,
+        ('1. Decimal', QTextListFormat.ListDecimal),
+        ('a. Lowercase Letters', QTextListFormat.ListLowerAlpha),
+        ('A. Uppercase Letters', QTextListFormat.ListUpperAlpha),
+        ('i. Lowercase Roman', QTextListFormat.ListLowerRoman),
+        ('I. Uppercase Roman', QTextListFormat.ListUpperRoman),
+        None,
+    ]
+    
+    # Toolbar entries: (attribute, icon, tooltip, slot name, checkable)
+    STYLE_ACTIONS = [
+        ('bold_action', Icons.BOLD, 'Bold', 'toggle_bold', True),
+        ('italic_action', Icons.ITALIC, 'Italic', 'toggle_italic', True),
+        ('underline_action', Icons.UNDERLINE, 'Underline', 'toggle_underline', True),
+        ('strikethrough_action', Icons.STRIKETHROUGH, 'Strikethrough', 'toggle_strikethrough', True),
+    ]
+    
+    # Alignment toolbar: (attribute, icon, tooltip, alignment)
+    ALIGN_ACTIONS = [
+        ('align_left_action', Icons.ALIGN_LEFT, 'Align Left', Qt.AlignLeft),
+        ('align_center_action', Icons.ALIGN_CENTER, 'Align Center', Qt.AlignCenter),
+        ('align_right_action', Icons.ALIGN_RIGHT, 'Align Right', Qt.AlignRight),
+        ('align_justify_action', Icons.ALIGN_JUSTIFY, 'Justify', Qt.AlignJustify),
+    ]
+    
     def __init__(self):
         super().__init__()
         
@@ -56,14 +158,93 @@ class KeepMeHonest(QMainWindow):
         self.icons = IconManager()
         self.writing_checker = WritingChecker()
         
+        # Issues and readability counts for each block's text from the last check
+        self._block_issue_cache = {}
+        
+        # Sequence number of the latest check; older results are discarded
+        self._check_seq = 0
+        
+        # Checks run one at a time; a check still waiting to start is dropped
+        # when a newer one replaces it
+        self._check_pool = QThreadPool(self)
+        self._check_pool.setMaxThreadCount(1)
+        self._queued_check = None
+        
+        # Set to ask the running check to stop; replaced for each check
+        self._check_cancel = threading.Event()
+        
+        # (config revision, text) of the running check and of the results shown;
+        # checks only read the text, so formatting edits never need a re-check
+        self._config_rev = 0
+        self._pending_check_key = None
+        self._last_check_key = None
+        
+        # Plain text of the document, keyed by document revision
+        self._cached_plain = (-1, "")
+        
+        # Selection shown in the readability panel
+        self._last_selection_text = None
+        
+        # File reads and writes run one at a time off the GUI thread
+        self._io_pool = QThreadPool(self)
+        self._io_pool.setMaxThreadCount(1)
+        self._io_progress = None
+        
+        # Print jobs still running; each keeps its printer alive until it is done
+        self._print_jobs = set()
+        self._print_progress = None
+        
+        # Called once the next save has been written, e.g. to close the window
+        self._after_save = None
+        
         # Settings
         self.spell_check_enabled = True
+        self.ignore_mixed_case = False
         self.writing_checker_visible = True
         
+        # Prototype formats for the style toggles, keyed by (style, on).
+        # New format actions should merge a prototype like these: merging sets
+        # only that property, so mixed formatting in a selection survives.
+        self._style_formats = {}
+        for style, setter, on_value, off_value in (
+            ('bold', 'setFontWeight', QFont.Bold, QFont.Normal),
+            ('italic', 'setFontItalic', True, False),
+            ('underline', 'setFontUnderline', True, False),
+            ('strikethrough', 'setFontStrikeOut', True, False),
+        ):
+            for on, value in ((True, on_value), (False, off_value)):
+                fmt = QTextCharFormat()
+                getattr(fmt, setter)(value)
+                self._style_formats[style, on] = fmt
+        
+        # Formatting last shown by the toolbar buttons
+        self._last_format = None
+        self._last_alignment = None
+        
+        # Set once the deferred setup after show() has run
+        self.setup_complete = False
+        self.highlighter = None
+        
         # Timer for debounced writing checks
         self.check_timer = QTimer()
+        self.check_timer.setSingleShot(True)  # Only fires after edits, never while idle
         self.check_timer.timeout.connect(self.run_writing_check)
-        self.check_timer.setInterval(1000)  # 1 second debounce
+        self.check_timer.setInterval(self.CHECK_DELAY_MIN)
+        
+        # Time since the first edit that no check has covered yet
+        self._unchecked_since = QElapsedTimer()
+        
+        # Timer coalescing selection changes before readability analysis
+        self.selection_timer = QTimer()
+        self.selection_timer.setSingleShot(True)
+        self.selection_timer.timeout.connect(self.update_selection_readability)
+        self.selection_timer.setInterval(120)
+        
+        # Timer coalescing cursor moves before the toolbar buttons are synced
+        self.toolbar_timer = QTimer()
+        self.toolbar_timer.setSingleShot(True)
+        self.toolbar_timer.timeout.connect(self.on_cursor_moved)
+        self.toolbar_timer.setInterval(40)
         
         self.setup_ui()
     
@@ -73,29 +254,38 @@ class KeepMeHonest(QMainWindow):
         self.setGeometry(100, 100, 1000, 600)
         
         self.setup_text_editor()
-        self.setup_spell_checker()
         self.setup_menus()
+        self.show()
+        
+        # Everything else is built once the window is on screen
+        QTimer.singleShot(0, self.finish_setup)
+    
+    def finish_setup(self):
+        """Set up the components deferred until after the window is shown."""
+        self.setup_spell_checker()
+        self.spell_check_action.setChecked(self.spell_check_enabled)
         self.setup_toolbars()
         self.setup_writing_checker_dock()
         self.connect_signals()
+        self.setup_complete = True
         
         # Show writing checker by default
         self.writing_checker_dock.show()
         self.writing_check_action.setChecked(True)
-        self.check_timer.start()
-        
-        self.show()
+        self.check_timer.start()  # Initial check once the event loop runs
     
     def setup_text_editor(self):
         """Create and configure text editor."""
         self.text_edit = SpellCheckTextEdit()
         self.text_edit.setFontPointSize(12)
         self.setCentralWidget(self.text_edit)
+        self.writing_highlighter = WritingHighlighter(self.text_edit)
     
     def setup_spell_checker(self):
         """Initialize spell checking."""
         try:
             self.highlighter = SpellCheckHighlighter(self.text_edit.document())
+            self.highlighter.ignore_mixed_case = self.ignore_mixed_case
             self.text_edit.set_spell_checker(self.highlighter)
         except Exception as e:
             print(f"Spell checker initialization failed: {e}")
@@ -110,54 +300,87 @@ class KeepMeHonest(QMainWindow):
         self.setup_edit_menu(menubar.addMenu('Edit'))
         self.setup_format_menu(menubar.addMenu('Format'))
         self.setup_tools_menu(menubar.addMenu('Tools'))
-        self.setup_help_menu(menubar.addMenu('Help'))
+        self.populate_on_show(menubar.addMenu('Help'), self.setup_help_menu)
+    
+    def populate_on_show(self, menu, populate):
+        """
+        Fill a menu the first time it opens instead of at startup.
+        Only for menus without shortcuts, which must exist to fire.
+        
+        Args:
+            menu: Empty QMenu to fill
+            populate: Callable adding the menu's actions, given the menu
+        """
+        menu.aboutToShow.connect(partial(self.populate_menu_once, menu, populate))
+        return menu
+    
+    def populate_menu_once(self, menu, populate):
+        """Fill a lazily populated menu unless it already has its actions."""
+        if not menu.actions():
+            populate(menu)
+    
+    def resolve_slot(self, name):
+        """Look up a slot by dotted attribute name, e.g. 'text_edit.undo'."""
+        target = self
+        for part in name.split('.'):
+            target = getattr(target, part)
+        return target
+    
+    def add_menu_actions(self, menu, entries):
+        """Add actions described by a menu table."""
+        for entry in entries:
+            if entry is None:
+                menu.addSeparator()
+                continue
+            label, slot = entry
+            shortcut = self.SHORTCUTS.get(slot)
+            if shortcut:
+                menu.addAction(label, self.resolve_slot(slot), shortcut)
+            else:
+                menu.addAction(label, self.resolve_slot(slot))
+    
+    def create_table_actions(self, entries):
+        """Create the actions described by a toolbar table."""
+        actions = []
+        for attribute, icon_name, tooltip, slot, checkable in entries:
+            action = self.create_toolbar_action(
+                icon_name, tooltip, self.SHORTCUTS.get(slot), self.resolve_slot(slot),
+                checkable=checkable
+            )
+            action.setText(tooltip)  # Label used when the action is also in a menu
+            if attribute:
+                setattr(self, attribute, action)
+            actions.append(action)
+        return actions
+    
+    def add_toolbar_actions(self, toolbar, entries):
+        """Create toolbar actions described by a toolbar table."""
+        toolbar.addActions(self.create_table_actions(entries))
     
     def setup_file_menu(self, menu):
         """Create File menu."""
-        menu.addAction('New', self.new_file, 'Ctrl+N')
-        menu.addAction('Open...', self.open_file, 'Ctrl+O')
-        menu.addAction('Save', self.save_file, 'Ctrl+S')
-        menu.addAction('Save As...', self.save_file_as, 'Ctrl+Shift+S')
-        menu.addSeparator()
-        menu.addAction('Print Preview...', self.print_preview)
-        menu.addAction('Print...', self.print_document, 'Ctrl+P')
-        menu.addSeparator()
-        menu.addAction('Exit', self.close, 'Ctrl+Q')
+        self.add_menu_actions(menu, self.FILE_MENU)
     
     def setup_edit_menu(self, menu):
         """Create Edit menu."""
-        menu.addAction('Undo', self.text_edit.undo, 'Ctrl+Z')
-        menu.addAction('Redo', self.text_edit.redo, 'Ctrl+Y')
-        menu.addSeparator()
-        menu.addAction('Cut', self.text_edit.cut, 'Ctrl+X')
-        menu.addAction('Copy', self.text_edit.copy, 'Ctrl+C')
-        menu.addAction('Paste', self.text_edit.paste, 'Ctrl+V')
-        menu.addSeparator()
-        menu.addAction('Find and Replace...', self.show_find_replace, 'Ctrl+F')
+        self.add_menu_actions(menu, self.EDIT_MENU)
     
     def setup_format_menu(self, menu):
         """Create Format menu."""
-        menu.addAction('Bold', self.toggle_bold, 'Ctrl+B')
-        menu.addAction('Italic', self.toggle_italic, 'Ctrl+I')
-        menu.addAction('Underline', self.toggle_underline, 'Ctrl+U')
-        menu.addAction('Strikethrough', self.toggle_strikethrough, 'Ctrl+Shift+X')
-        menu.addSeparator()
-        menu.addAction('Highlight Color...', self.change_highlight_color)
+        # The toolbar shows these same actions, so each shortcut has one owner
+        self.style_actions = self.create_table_actions(self.STYLE_ACTIONS)
+        menu.addActions(self.style_actions)
         menu.addSeparator()
+        self.add_menu_actions(menu, self.FORMAT_MENU)
         
-        align_menu = menu.addMenu('Alignment')
-        align_menu.addAction('Align Left', lambda: self.set_alignment(Qt.AlignLeft))
-        align_menu.addAction('Align Center', lambda: self.set_alignment(Qt.AlignCenter))
-        align_menu.addAction('Align Right', lambda: self.set_alignment(Qt.AlignRight))
-        align_menu.addAction('Justify', lambda: self.set_alignment(Qt.AlignJustify))
+        self.populate_on_show(menu.addMenu('Alignment'), self.setup_alignment_menu)
         
         menu.addSeparator()
-        menu.addAction('Bullet List', self.toggle_bullet_list)
-        menu.addAction('Numbered List', self.toggle_numbered_list)
-        menu.addSeparator()
-        menu.addAction('Add Current Font to Favorites', 
-                      self.add_current_font_to_favorites, 'Ctrl+Shift+F')
-        menu.addAction('Manage Favorite Fonts...', self.manage_favorites)
+        self.add_menu_actions(menu, self.LIST_FONT_MENU)
+    
+    def setup_alignment_menu(self, menu):
+        """Create Format > Alignment submenu from the alignment toolbar's actions."""
+        menu.addActions(self.alignment_actions)
     
     def setup_tools_menu(self, menu):
         """Create Tools menu."""
@@ -167,6 +390,12 @@ class KeepMeHonest(QMainWindow):
         self.spell_check_action.triggered.connect(self.toggle_spell_check)
         menu.addAction(self.spell_check_action)
         
+        self.ignore_mixed_case_action = QAction('Ignore Mixed-Case Words', self)
+        self.ignore_mixed_case_action.setCheckable(True)
+        self.ignore_mixed_case_action.setChecked(self.ignore_mixed_case)
+        self.ignore_mixed_case_action.triggered.connect(self.toggle_ignore_mixed_case)
+        menu.addAction(self.ignore_mixed_case_action)
+        
         menu.addSeparator()
         
         self.writing_check_action = QAction('Writing Checker', self)
@@ -201,32 +430,15 @@ class KeepMeHonest(QMainWindow):
         self.font_size = QSpinBox()
         self.font_size.setRange(8, 72)
         self.font_size.setValue(12)
+        # Typed sizes apply on Enter or focus loss, not on every digit
+        self.font_size.setKeyboardTracking(False)
         self.font_size.valueChanged.connect(self.change_font_size)
         toolbar.addWidget(self.font_size)
         
         toolbar.addSeparator()
         
         # Text style buttons
-        self.bold_action = self.create_toolbar_action(
-            Icons.BOLD, 'Bold', 'Ctrl+B', self.toggle_bold, checkable=True
-        )
-        toolbar.addAction(self.bold_action)
-        
-        self.italic_action = self.create_toolbar_action(
-            Icons.ITALIC, 'Italic', 'Ctrl+I', self.toggle_italic, checkable=True
-        )
-        toolbar.addAction(self.italic_action)
-        
-        self.underline_action = self.create_toolbar_action(
-            Icons.UNDERLINE, 'Underline', 'Ctrl+U', self.toggle_underline, checkable=True
-        )
-        toolbar.addAction(self.underline_action)
-        
-        self.strikethrough_action = self.create_toolbar_action(
-            Icons.STRIKETHROUGH, 'Strikethrough', 'Ctrl+Shift+X', 
-            self.toggle_strikethrough, checkable=True
-        )
-        toolbar.addAction(self.strikethrough_action)
+        toolbar.addActions(self.style_actions)
         
         # List menu button
         list_button = QToolButton()
@@ -239,9 +451,9 @@ class KeepMeHonest(QMainWindow):
         toolbar.addSeparator()
         
         # Highlight button
-        toolbar.addAction(self.create_toolbar_action(
-            Icons.HIGHLIGHT, 'Highlight', None, self.change_highlight_color
-        ))
+        self.add_toolbar_actions(toolbar, [
+            (None, Icons.HIGHLIGHT, 'Highlight', 'change_highlight_color', False),
+        ])
     
     def setup_alignment_toolbar(self):
         """Create alignment toolbar."""
@@ -250,29 +462,21 @@ class KeepMeHonest(QMainWindow):
         toolbar.setIconSize(QSize(16, 16))
         self.addToolBar(toolbar)
         
-        self.align_left_action = self.create_toolbar_action(
-            Icons.ALIGN_LEFT, 'Align Left', None,
-            lambda: self.set_alignment(Qt.AlignLeft), checkable=True
-        )
-        toolbar.addAction(self.align_left_action)
-        
-        self.align_center_action = self.create_toolbar_action(
-            Icons.ALIGN_CENTER, 'Align Center', None,
-            lambda: self.set_alignment(Qt.AlignCenter), checkable=True
-        )
-        toolbar.addAction(self.align_center_action)
-        
-        self.align_right_action = self.create_toolbar_action(
-            Icons.ALIGN_RIGHT, 'Align Right', None,
-            lambda: self.set_alignment(Qt.AlignRight), checkable=True
-        )
-        toolbar.addAction(self.align_right_action)
-        
-        self.align_justify_action = self.create_toolbar_action(
-            Icons.ALIGN_JUSTIFY, 'Justify', None,
-            lambda: self.set_alignment(Qt.AlignJustify), checkable=True
-        )
-        toolbar.addAction(self.align_justify_action)
+        # Each action carries its alignment; the exclusive group keeps one
+        # checked and reports clicks through a single connection
+        self.align_group = QActionGroup(self)
+        self.align_group.triggered.connect(self.on_align_action)
+        self.alignment_actions = []
+        for attribute, icon_name, tooltip, alignment in self.ALIGN_ACTIONS:
+            action = self.create_toolbar_action(
+                icon_name, tooltip, None, None, checkable=True
+            )
+            action.setText(tooltip)  # Label in the Format > Alignment submenu
+            action.setData(int(alignment))
+            setattr(self, attribute, action)
+            self.align_group.addAction(action)
+            self.alignment_actions.append(action)
+        toolbar.addActions(self.alignment_actions)
     
     def setup_paragraph_toolbar(self):
         """Create paragraph toolbar."""
@@ -287,34 +491,23 @@ class KeepMeHonest(QMainWindow):
         self.line_spacing.setRange(0.5, 3.0)
         self.line_spacing.setSingleStep(0.1)
         self.line_spacing.setValue(1.0)
+        self.line_spacing.setKeyboardTracking(False)
         self.line_spacing.valueChanged.connect(self.change_line_spacing)
         toolbar.addWidget(self.line_spacing)
     
     def create_list_menu(self):
         """Create list style menu."""
-        menu = QMenu()
-        
-        menu.addAction('• Disc Bullets', 
-                      lambda: self.set_list_style(QTextListFormat.ListDisc))
-        menu.addAction('◦ Circle Bullets', 
-                      lambda: self.set_list_style(QTextListFormat.ListCircle))
-        menu.addAction('▪ Square Bullets', 
-                      lambda: self.set_list_style(QTextListFormat.ListSquare))
-        menu.addSeparator()
-        menu.addAction('1. Decimal', 
-                      lambda: self.set_list_style(QTextListFormat.ListDecimal))
-        menu.addAction('a. Lowercase Letters', 
-                      lambda: self.set_list_style(QTextListFormat.ListLowerAlpha))
-        menu.addAction('A. Uppercase Letters', 
-                      lambda: self.set_list_style(QTextListFormat.ListUpperAlpha))
-        menu.addAction('i. Lowercase Roman', 
-                      lambda: self.set_list_style(QTextListFormat.ListLowerRoman))
-        menu.addAction('I. Uppercase Roman', 
-                      lambda: self.set_list_style(QTextListFormat.ListUpperRoman))
-        menu.addSeparator()
+        return self.populate_on_show(QMenu(), self.setup_list_menu)
+    
+    def setup_list_menu(self, menu):
+        """Add the list style actions to the list menu."""
+        for entry in self.LIST_STYLE_MENU:
+            if entry is None:
+                menu.addSeparator()
+            else:
+                label, style = entry
+                menu.addAction(label, partial(self.set_list_style, style))
         menu.addAction('Remove List', self.remove_list)
-        
-        return menu
     
     def setup_writing_checker_dock(self):
         """Create writing checker sidebar."""
@@ -329,10 +522,16 @@ class KeepMeHonest(QMainWindow):
     
     def connect_signals(self):
         """Connect all signals."""
-        self.text_edit.cursorPositionChanged.connect(self.update_format_buttons)
-        self.text_edit.cursorPositionChanged.connect(self.update_paragraph_buttons)
+        self.text_edit.cursorPositionChanged.connect(self.toolbar_timer.start)
+        # Keeps the buttons in sync when formatting changes without the cursor moving
+        self.text_edit.currentCharFormatChanged.connect(self.update_format_buttons)
         self.text_edit.textChanged.connect(self.schedule_writing_check)
-        self.text_edit.selectionChanged.connect(self.update_selection_readability)
+        self.text_edit.selectionChanged.connect(self.selection_timer.start)
+        
+        # Issue highlights are painted as they scroll into view
+        scroll_bar = self.text_edit.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self.paint_visible_issues)
+        scroll_bar.rangeChanged.connect(self.paint_visible_issues)
     
     def create_toolbar_action(self, icon_name, tooltip, shortcut, callback, checkable=False):
         """Helper to create toolbar action with icon."""
@@ -340,42 +539,135 @@ class KeepMeHonest(QMainWindow):
         action.setToolTip(tooltip)
         if shortcut:
             action.setShortcut(shortcut)
-        action.triggered.connect(callback)
+        if callback:
+            action.triggered.connect(callback)
         if checkable:
             action.setCheckable(True)
         return action
     
+    def plain_text(self):
+        """Get the document's plain text, reusing it until the document changes."""
+        revision = self.text_edit.document().revision()
+        if revision != self._cached_plain[0]:
+            self._cached_plain = (revision, self.text_edit.toPlainText())
+        return self._cached_plain[1]
+    
     # ========== Writing Checker ==========
     
-    def toggle_writing_checker(self):
-        """Toggle writing checker visibility."""
-        self.writing_checker_visible = not self.writing_checker_visible
+    def toggle_writing_checker(self, checked):
+        """
+        Show or hide the writing checker.
+        
+        Args:
+            checked: New checked state of the Writing Checker action
+        """
+        if not self.setup_complete:
+            self.writing_check_action.setChecked(self.writing_checker_visible)
+            return
+        
+        self.writing_checker_visible = checked
         if self.writing_checker_visible:
             self.writing_checker_dock.show()
             self.run_writing_check()
-            self.check_timer.start()
         else:
             self.writing_checker_dock.hide()
             self.check_timer.stop()
-            WritingHighlighter.highlight_issues(self.text_edit, [])
+            self.cancel_writing_check()
+            self._pending_check_key = self._last_check_key = None
+            self.writing_highlighter.highlight_issues([])
         self.writing_check_action.setChecked(self.writing_checker_visible)
     
     def schedule_writing_check(self):
         """Schedule writing check (debounced)."""
         if self.writing_checker_visible:
             # Don't run check if user has text selected
-            if not self.text_edit.textCursor().hasSelection():
-                self.check_timer.stop()
-                self.check_timer.start()
+            if self.text_edit.textCursor().hasSelection():
+                return
+            
+            # Longer documents wait for a longer pause
+            length = self.text_edit.document().characterCount()
+            delay = min(self.CHECK_DELAY_MAX, max(self.CHECK_DELAY_MIN, length // 50))
+            
+            # ...but never past CHECK_MAX_WAIT after the first unchecked edit,
+            # so continuous typing can't postpone the check forever
+            if not self._unchecked_since.isValid():
+                self._unchecked_since.start()
+            remaining = self.CHECK_MAX_WAIT - self._unchecked_since.elapsed()
+            if remaining <= 0:
+                self.run_writing_check()
+            else:
+                self.check_timer.start(min(delay, remaining))
     
     def run_writing_check(self):
         """Run writing checker."""
         self.check_timer.stop()
+        self._unchecked_since.invalidate()
         if not self.writing_checker:
             return
         
-        text = self.text_edit.toPlainText()
-        issues, readability_data = self.writing_checker.check_text(text)
+        # Nothing to do if the shown results, or a running check, cover this text
+        key = (self._config_rev, self.plain_text())
+        if key == self._last_check_key:
+            # Formatting, or typing then deleting, bumps the revision without
+            # changing the text; the shown issues still apply to the new one
+            self.writing_highlighter.highlight_issues(self.writing_checker_dock.issues)
+            return
+        if key == self._pending_check_key:
+            return
+        self._pending_check_key = key
+        
+        self._check_seq += 1
+        self.cancel_writing_check()
+        
+        # An empty document has nothing to analyze; clear the results directly
+        document = self.text_edit.document()
+        if document.isEmpty():
+            self.on_writing_check_finished(
+                self._check_seq, [], self.writing_checker.readability.analyze_blocks([]),
+                self._block_issue_cache
+            )
+            return
+        
+        # Snapshot the document; the analysis runs in the thread pool
+        blocks = []
+        block = document.begin()
+        while block.isValid():
+            blocks.append((block.position(), block.text()))
+            block = block.next()
+        
+        worker = WritingCheckWorker(
+            self.writing_checker, self._check_seq, blocks, self._block_issue_cache,
+            self._check_cancel
+        )
+        worker.signals.finished.connect(self.on_writing_check_finished)
+        self._queued_check = worker
+        self._check_pool.start(worker)
+    
+    def cancel_writing_check(self):
+        """Drop a check still waiting to start and ask a running one to stop."""
+        if self._queued_check is not None:
+            self._queued_check.withdraw(self._check_pool)
+            self._queued_check = None
+        self._check_cancel.set()
+        self._check_cancel = threading.Event()
+    
+    def on_writing_check_finished(self, seq, issues, readability_data, block_cache):
+        """Apply results from the latest writing check."""
+        if seq == self._check_seq:
+            self._queued_check = None
+        if seq != self._check_seq or not self.writing_checker_visible:
+            return
+        key, self._pending_check_key = self._pending_check_key, None
+        
+        # Per-block results stay valid after edits, so the next check reuses them
+        if key[0] == self._config_rev:
+            self._block_issue_cache = block_cache
+        
+        # Positions are stale if the text was edited while checking;
+        # the edit has already scheduled a fresh check
+        if self.plain_text() != key[1]:
+            return
+        self._last_check_key = key
         
         # Update readability display
         grade = readability_data.get('flesch_kincaid_grade', 0)
@@ -384,7 +676,7 @@ class KeepMeHonest(QMainWindow):
         self.update_selection_readability()
         
         self.writing_checker_dock.set_issues(issues)
-        WritingHighlighter.highlight_issues(self.text_edit, issues)
+        self.writing_highlighter.highlight_issues(issues)
     
     def update_selection_readability(self):
         """Update readability for selection."""
@@ -392,16 +684,28 @@ class KeepMeHonest(QMainWindow):
             return
         
         cursor = self.text_edit.textCursor()
-        if cursor.hasSelection():
-            selected_text = cursor.selectedText()
-            analysis = self.writing_checker.get_readability_compact(selected_text)
+        selected_text = cursor.selectedText() if cursor.hasSelection() else None
+        if selected_text == self._last_selection_text:
+            return
+        self._last_selection_text = selected_text
+        
+        if selected_text:
+            analysis = self.writing_checker.get_readability_compact(
+                selected_text, self._block_issue_cache
+            )
             self.writing_checker_dock.set_selection_readability(f"✓ {analysis}")
         else:
             self.writing_checker_dock.set_selection_readability("(Select text to analyze)")
     
+    def paint_visible_issues(self):
+        """Highlight issues that have scrolled into view."""
+        self.writing_highlighter.paint_visible()
+    
     def on_check_type_changed(self, check_type, enabled):
         """Handle check type toggle."""
         self.writing_checker.set_check_enabled(check_type, enabled)
+        self._block_issue_cache = {}
+        self._config_rev += 1
         self.run_writing_check()
     
     def on_ignore_issue(self, issue_index):
@@ -409,7 +713,8 @@ class KeepMeHonest(QMainWindow):
         issues = self.writing_checker_dock.issues
         if 0 <= issue_index < len(issues):
             issues.pop(issue_index)
-            WritingHighlighter.highlight_issues(self.text_edit, issues)
+            self._last_check_key = None  # Let a refresh bring the issue back
+            self.writing_highlighter.highlight_issues(issues)
             self.writing_checker_dock.set_issues(issues)
             if issues:
                 next_index = min(issue_index, len(issues) - 1)
@@ -419,12 +724,16 @@ class KeepMeHonest(QMainWindow):
         """Add cinnamon word."""
         self.writing_checker.add_cinnamon_word(word)
         self.writing_checker_dock.set_cinnamon_words(self.writing_checker.cinnamon_words)
+        self._block_issue_cache = {}
+        self._config_rev += 1
         self.run_writing_check()
     
     def on_remove_cinnamon_word(self, word):
         """Remove cinnamon word."""
         self.writing_checker.remove_cinnamon_word(word)
         self.writing_checker_dock.set_cinnamon_words(self.writing_checker.cinnamon_words)
+        self._block_issue_cache = {}
+        self._config_rev += 1
         self.run_writing_check()
     
     # ========== Font Management ==========
@@ -447,49 +756,57 @@ class KeepMeHonest(QMainWindow):
             QMessageBox.information(self, 'Already Added', 
                                   f'"{current_font}" is already in favorites.')
     
+    def save_favorites(self):
+        """Persist the font combo's favorites."""
+        self.font_manager.save_favorites(self.font_combo.favorites)
+    
     def manage_favorites(self):
         """Open favorites dialog."""
         dialog = FavoriteFontsDialog(self.font_combo.favorites, self)
         if dialog.exec_() == QDialog.Accepted:
             self.font_combo.set_favorites(dialog.get_favorites())
-            self.font_manager.save_favorites(self.font_combo.favorites)
+            self.save_favorites()
     
     # ========== Text Formatting ==========
     
     def toggle_bold(self):
         """Toggle bold."""
-        fmt = self.text_edit.currentCharFormat()
-        weight = QFont.Normal if fmt.fontWeight() == QFont.Bold else QFont.Bold
-        fmt.setFontWeight(weight)
-        self.text_edit.setCurrentCharFormat(fmt)
+        bold = self.text_edit.fontWeight() != QFont.Bold
+        self.text_edit.mergeCurrentCharFormat(self._style_formats['bold', bold])
     
     def toggle_italic(self):
         """Toggle italic."""
-        self.text_edit.setFontItalic(not self.text_edit.fontItalic())
+        italic = not self.text_edit.fontItalic()
+        self.text_edit.mergeCurrentCharFormat(self._style_formats['italic', italic])
     
     def toggle_underline(self):
         """Toggle underline."""
-        self.text_edit.setFontUnderline(not self.text_edit.fontUnderline())
+        underline = not self.text_edit.fontUnderline()
+        self.text_edit.mergeCurrentCharFormat(self._style_formats['underline', underline])
     
     def toggle_strikethrough(self):
         """Toggle strikethrough."""
-        fmt = self.text_edit.currentCharFormat()
-        fmt.setFontStrikeOut(not fmt.fontStrikeOut())
-        self.text_edit.setCurrentCharFormat(fmt)
+        strike = not self.text_edit.currentCharFormat().fontStrikeOut()
+        self.text_edit.mergeCurrentCharFormat(self._style_formats['strikethrough', strike])
     
     def change_highlight_color(self):
         """Change highlight color."""
         color = QColorDialog.getColor()
         if color.isValid():
-            fmt = self.text_edit.currentCharFormat()
+            fmt = QTextCharFormat()
             fmt.setBackground(color)
-            self.text_edit.setCurrentCharFormat(fmt)
+            self.text_edit.mergeCurrentCharFormat(fmt)
     
     # ========== Paragraph Formatting ==========
     
     def set_alignment(self, alignment):
         """Set alignment."""
         self.text_edit.setAlignment(alignment)
+        self.update_paragraph_buttons()
+    
+    def on_align_action(self, action):
+        """Apply the alignment stored on the triggered alignment action."""
+        self.set_alignment(Qt.Alignment(action.data()))
     
     def toggle_bullet_list(self):
         """Toggle bullet list."""
@@ -528,18 +845,35 @@ class KeepMeHonest(QMainWindow):
     
     # ========== Spell Check ==========
     
-    def toggle_spell_check(self):
-        """Toggle spell check."""
+    def toggle_spell_check(self, checked):
+        """
+        Enable or disable spell check.
+        
+        Args:
+            checked: New checked state of the Enable Spell Check action
+        """
         if self.highlighter:
-            self.spell_check_enabled = not self.spell_check_enabled
+            self.spell_check_enabled = checked
             self.highlighter.set_enabled(self.spell_check_enabled)
-            self.spell_check_action.setChecked(self.spell_check_enabled)
+        self.spell_check_action.setChecked(self.spell_check_enabled)
+    
+    def toggle_ignore_mixed_case(self, checked):
+        """
+        Skip or check CamelCase, ALLCAPS and overlong words.
+        
+        Args:
+            checked: New checked state of the Ignore Mixed-Case Words action
+        """
+        self.ignore_mixed_case = checked
+        if self.highlighter:
+            self.highlighter.set_ignore_mixed_case(checked)
     
     # ========== Find/Replace ==========
     
     def show_find_replace(self):
         """Show find/replace dialog."""
-        if not self.find_dialog:
+        # Closing only hides the dialog, so it keeps the last search
+        if self.find_dialog is None:
             self.find_dialog = FindReplaceDialog(self)
         self.find_dialog.show()
         self.find_dialog.raise_()
@@ -555,79 +889,236 @@ class KeepMeHonest(QMainWindow):
                 QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
             )
             if reply == QMessageBox.Yes:
-                self.save_file()
+                self.save_then(self.clear_document)
+                return
             elif reply == QMessageBox.Cancel:
                 return
         
-        self.text_edit.clear()
+        self.clear_document()
+    
+    def clear_document(self):
+        """Replace the document with an empty, untitled one."""
+        with self.bulk_edit():
+            self.text_edit.clear()
+        self._cached_plain = (-1, "")  # Clearing may restart the revision count
         self.current_file = None
         self.setWindowTitle(f'Keep Me Honest v{self.VERSION} - Untitled')
     
+    @contextmanager
+    def bulk_edit(self):
+        """
+        Replace the whole document without spell checking it block by block.
+        
+        The highlighter is detached during the edit. Reattaching it queues a
+        single rehighlight, which runs after the new text has been shown.
+        """
+        if not self.highlighter or not self.spell_check_enabled:
+            yield
+            return
+        self.highlighter.setDocument(None)
+        try:
+            yield
+        finally:
+            self.highlighter.setDocument(self.text_edit.document())
+    
     def open_file(self):
         """Open file."""
-        filename, _ = QFileDialog.getOpenFileName(
-            self, 'Open File', '',
-            'Text Files (*.txt);;HTML Files (*.html);;All Files (*)'
-        )
-        if filename:
-            try:
-                with open(filename, 'r') as f:
-                    content = f.read()
-                    if filename.endswith('.html'):
-                        self.text_edit.setHtml(content)
-                    else:
-                        self.text_edit.setPlainText(content)
-                self.current_file = filename
-                self.setWindowTitle(f'Keep Me Honest v{self.VERSION} - {os.path.basename(filename)}')
-            except Exception as e:
-                QMessageBox.warning(self, 'Error', f'Could not open file: {e}')
+        self.show_file_dialog('Open File', QFileDialog.AcceptOpen, self.load_file)
+    
+    def show_file_dialog(self, title, accept_mode, slot):
+        """Show a window-modal file dialog that calls slot with the chosen file."""
+        # open() returns at once, so timers and check results keep being handled
+        dialog = QFileDialog(self, title)
+        dialog.setNameFilter(self.FILE_FILTER)
+        dialog.setAcceptMode(accept_mode)
+        if accept_mode == QFileDialog.AcceptOpen:
+            dialog.setFileMode(QFileDialog.ExistingFile)
+        else:
+            # Nothing will be saved, so don't close or clear afterwards
+            dialog.rejected.connect(self.cancel_after_save)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.fileSelected.connect(slot)
+        dialog.open()
+    
+    def load_file(self, filename):
+        """Read a file in the background and show it when loaded."""
+        worker = FileLoadWorker(filename)
+        worker.signals.loaded.connect(self.on_file_loaded)
+        worker.signals.failed.connect(self.on_file_open_failed)
+        # Edits made while loading would be thrown away by setHtml/setPlainText
+        self.text_edit.setReadOnly(True)
+        self.show_file_progress('Opening file...')
+        self._io_pool.start(worker)
+    
+    def on_file_loaded(self, filename, content):
+        """Show a file read by the background loader."""
+        self.hide_file_progress()
+        self.text_edit.setReadOnly(False)
+        with self.bulk_edit():
+            if filename.endswith('.html'):
+                self.text_edit.setHtml(content)
+            else:
+                self.text_edit.setPlainText(content)
+        self._cached_plain = (-1, "")
+        self.current_file = filename
+        self.setWindowTitle(f'Keep Me Honest v{self.VERSION} - {os.path.basename(filename)}')
+    
+    def on_file_open_failed(self, filename, error):
+        """Report a file that could not be read."""
+        self.hide_file_progress()
+        self.text_edit.setReadOnly(False)
+        QMessageBox.warning(self, 'Error', f'Could not open file: {error}')
     
     def save_file(self):
-        """Save file."""
+        """
+        Save file.
+        
+        The document is serialized here and written to disk in the background.
+        
+        Returns:
+            True if a save was started, False if a file name is being asked for
+        """
         if self.current_file:
-            try:
-                with open(self.current_file, 'w') as f:
-                    if self.current_file.endswith('.html'):
-                        f.write(self.text_edit.toHtml())
-                    else:
-                        f.write(self.text_edit.toPlainText())
-                self.text_edit.document().setModified(False)
-                return True
-            except Exception as e:
-                QMessageBox.warning(self, 'Error', f'Could not save: {e}')
-                return False
-        return self.save_file_as()
+            document = self.text_edit.document()
+            if self.current_file.endswith('.html'):
+                data = document.toHtml(b'utf-8').encode('utf-8')
+            else:
+                data = self.plain_text().encode('utf-8')
+            
+            worker = FileSaveWorker(self.current_file, data, document.revision())
+            worker.signals.saved.connect(self.on_file_saved)
+            worker.signals.failed.connect(self.on_file_save_failed)
+            self.show_file_progress('Saving...')
+            self._io_pool.start(worker)
+            return True
+        self.save_file_as()
+        return False
+    
+    def save_then(self, callback):
+        """Save the document and call callback once it has been written."""
+        self._after_save = callback
+        self.save_file()
+    
+    def cancel_after_save(self):
+        """Drop the action waiting on a save that won't happen."""
+        self._after_save = None
+    
+    def on_file_saved(self, filename, revision):
+        """Mark the document clean if it hasn't been edited since it was saved."""
+        self.hide_file_progress()
+        document = self.text_edit.document()
+        if filename == self.current_file and revision == document.revision():
+            document.setModified(False)
+        
+        callback, self._after_save = self._after_save, None
+        if callback:
+            callback()
+    
+    def on_file_save_failed(self, filename, error):
+        """Report a save that could not be written."""
+        self.hide_file_progress()
+        self.cancel_after_save()
+        QMessageBox.warning(self, 'Error', f'Could not save: {error}')
+    
+    def show_file_progress(self, label):
+        """Show a busy indicator if a file operation takes noticeably long."""
+        if self._io_progress is None:
+            self._io_progress = QProgressDialog(self)
+            self._io_progress.setCancelButton(None)
+            self._io_progress.setRange(0, 0)
+            self._io_progress.setMinimumDuration(300)
+            self._io_progress.setWindowModality(Qt.WindowModal)
+            self._io_progress.reset()  # Don't let the construction-time timer show it
+        self._io_progress.setLabelText(label)
+        self._io_progress.setValue(0)
+    
+    def hide_file_progress(self):
+        """Hide the busy indicator once the file operation is done."""
+        if self._io_progress is not None:
+            self._io_progress.reset()
     
     def save_file_as(self):
         """Save file as."""
-        filename, _ = QFileDialog.getSaveFileName(
-            self, 'Save File As', '',
-            'Text Files (*.txt);;HTML Files (*.html);;All Files (*)'
-        )
-        if filename:
-            # Add .txt extension if no extension provided
-            if not os.path.splitext(filename)[1]:
-                filename += '.txt'
-            self.current_file = filename
-            self.setWindowTitle(f'Keep Me Honest v{self.VERSION} - {os.path.basename(filename)}')
-            return self.save_file()
-        return False
+        self.show_file_dialog('Save File As', QFileDialog.AcceptSave, self.save_file_to)
+    
+    def save_file_to(self, filename):
+        """Save the document under a new file name."""
+        # Add .txt extension if no extension provided
+        if not os.path.splitext(filename)[1]:
+            filename += '.txt'
+        self.current_file = filename
+        self.setWindowTitle(f'Keep Me Honest v{self.VERSION} - {os.path.basename(filename)}')
+        self.save_file()
         
     # ========== Print ==========
     
     def print_document(self):
         """Print document."""
+        # QtPrintSupport is only loaded once printing is first used
+        from PyQt5.QtPrintSupport import QPrintDialog, QPrinter
         printer = QPrinter(QPrinter.HighResolution)
         dialog = QPrintDialog(printer, self)
         if dialog.exec_() == QPrintDialog.Accepted:
-            self.text_edit.document().print_(printer)
+            self.print_in_background(printer)
+    
+    def print_in_background(self, printer):
+        """Paginate and print a snapshot of the document on a worker thread."""
+        # The copy and its layout are created here, then handed to the thread
+        # along with the job, so printing never touches the live document
+        document = self.text_edit.document().clone()
+        document.documentLayout()
+        
+        thread = QThread(self)
+        job = DocumentPrinter(document, printer)
+        job.moveToThread(thread)
+        document.moveToThread(thread)
+        thread.started.connect(job.run)
+        job.finished.connect(thread.quit)
+        job.finished.connect(self.on_print_finished)
+        thread.finished.connect(job.deleteLater)
+        thread.finished.connect(document.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        
+        self._print_jobs.add(job)
+        self.update_print_progress()
+        thread.start()
+    
+    def on_print_finished(self, job):
+        """Forget a finished print job and update the printing indicator."""
+        self._print_jobs.discard(job)
+        self.update_print_progress()
+    
+    def update_print_progress(self):
+        """Show how many print jobs are running, or hide the indicator when none are."""
+        count = len(self._print_jobs)
+        if not count:
+            if self._print_progress is not None:
+                self._print_progress.reset()
+            return
+        if self._print_progress is None:
+            # Not modal: printing runs in the background while editing continues
+            self._print_progress = QProgressDialog(self)
+            self._print_progress.setWindowTitle('Printing')
+            self._print_progress.setCancelButton(None)
+            self._print_progress.setRange(0, 0)
+            self._print_progress.setMinimumDuration(300)
+            self._print_progress.reset()  # Don't let the construction-time timer show it
+        self._print_progress.setLabelText(
+            'Printing...' if count == 1 else f'Printing {count} documents...'
+        )
+        self._print_progress.setValue(0)
     
     def print_preview(self):
         """Print preview."""
+        from PyQt5.QtPrintSupport import QPrinter, QPrintPreviewDialog
         printer = QPrinter(QPrinter.HighResolution)
         preview = QPrintPreviewDialog(printer, self)
-        preview.paintRequested.connect(lambda p: self.text_edit.document().print_(p))
+        # The preview caches rendered pages itself and repaints only when the
+        # page setup changes; render those repaints from one snapshot
+        document = self.text_edit.document().clone(preview)
+        preview.paintRequested.connect(document.print_)
         preview.exec_()
+        preview.deleteLater()
     
     # ========== Help ==========
     
@@ -650,40 +1141,87 @@ class KeepMeHonest(QMainWindow):
     
     # ========== UI Updates ==========
     
-    def update_format_buttons(self):
+    def on_cursor_moved(self):
+        """Read the cursor's format and alignment once and sync both button groups."""
+        # currentCharFormat() and alignment() would each fetch their own cursor
+        cursor = self.text_edit.textCursor()
+        self.update_format_buttons(cursor.charFormat())
+        self.update_paragraph_buttons(cursor.blockFormat().alignment())
+    
+    def update_format_buttons(self, fmt=None):
         """Update format button states."""
-        fmt = self.text_edit.currentCharFormat()
+        if fmt is None:
+            fmt = self.text_edit.currentCharFormat()
+        font = fmt.font()
         
-        self.bold_action.setChecked(fmt.fontWeight() == QFont.Bold)
-        self.italic_action.setChecked(fmt.font().italic())
-        self.underline_action.setChecked(fmt.font().underline())
-        self.strikethrough_action.setChecked(fmt.fontStrikeOut())
+        # Skip the widget updates when moving within identically formatted text
+        styles = (fmt.fontWeight() == QFont.Bold, font.italic(), font.underline(),
+                  fmt.fontStrikeOut())
+        fingerprint = (styles, font.family(), font.pointSize())
+        last = self._last_format or (None, None, None)
+        if fingerprint == last:
+            return
+        self._last_format = fingerprint
+        
+        # Only touch the widgets whose value changed
+        if styles != last[0]:
+            self.set_actions_checked(zip(
+                (self.bold_action, self.italic_action,
+                 self.underline_action, self.strikethrough_action),
+                styles
+            ))
         
-        self.font_combo.setCurrentFont(fmt.font())
-        point_size = fmt.font().pointSize()
-        self.font_size.setValue(int(point_size) if point_size > 0 else 12)
+        # Block signals so syncing the widgets doesn't re-apply the font to the text
+        if fingerprint[1] != last[1]:
+            self.font_combo.blockSignals(True)
+            self.font_combo.setCurrentFont(font)
+            self.font_combo.blockSignals(False)
+        
+        point_size = fingerprint[2]
+        if point_size != last[2]:
+            self.font_size.blockSignals(True)
+            self.font_size.setValue(int(point_size) if point_size > 0 else 12)
+            self.font_size.blockSignals(False)
     
-    def update_paragraph_buttons(self):
+    def update_paragraph_buttons(self, alignment=None):
         """Update paragraph button states."""
-        alignment = self.text_edit.alignment()
+        if alignment is None:
+            alignment = self.text_edit.alignment()
+        if alignment == self._last_alignment:
+            return
+        self._last_alignment = alignment
         
-        self.align_left_action.setChecked(alignment == Qt.AlignLeft)
-        self.align_center_action.setChecked(alignment == Qt.AlignCenter)
-        self.align_right_action.setChecked(alignment == Qt.AlignRight)
-        self.align_justify_action.setChecked(alignment == Qt.AlignJustify)
+        # Checking an action in the exclusive group unchecks the others
+        for action in self.alignment_actions:
+            if action.data() == int(alignment):
+                action.setChecked(True)
+                return
+        checked = self.align_group.checkedAction()
+        if checked:
+            checked.setChecked(False)
+    
+    @staticmethod
+    def set_actions_checked(states):
+        """Set (action, checked) pairs without emitting the actions' signals."""
+        for action, checked in states:
+            # Buttons still follow the change: they're updated by events, not signals
+            action.blockSignals(True)
+            action.setChecked(checked)
+            action.blockSignals(False)
     
     def closeEvent(self, event):
         """Handle close."""
+        self.font_manager.flush()
+        
         if self.text_edit.document().isModified():
             reply = QMessageBox.question(
                 self, 'Save Changes?', 'Save before closing?',
                 QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
             )
             if reply == QMessageBox.Yes:
-                if self.save_file():
-                    event.accept()
-                else:
-                    event.ignore()
+                # Close again once the save has been written
+                event.ignore()
+                self.save_then(self.close)
             elif reply == QMessageBox.No:
                 event.accept()
             else:
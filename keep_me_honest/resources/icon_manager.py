@@ -8,6 +8,12 @@ from PyQt5.QtCore import QSize
 class IconManager:
     """Manages application icons."""
     
+    # Supported file extensions, in order of preference
+    EXTENSIONS = ['.svg', '.png', '.jpg', '.ico']
+    
+    # Shared empty icon returned for every missing name
+    _MISSING = QIcon()
+    
     def __init__(self, icon_dir=None):
         """
         Initialize icon manager.
@@ -21,6 +27,7 @@ class IconManager:
             icon_dir = os.path.join(base_dir, 'icons')
         self.icon_dir = icon_dir
         self.icon_cache = {}
+        self._warned = set()
         
         # Default icon size
         self.default_size = QSize(20, 20)
@@ -28,6 +35,23 @@ class IconManager:
         # Create icons directory if it doesn't exist
         if not os.path.exists(self.icon_dir):
             os.makedirs(self.icon_dir)
+        
+        self.rescan()
+    
+    def rescan(self):
+        """Index the icon directory so lookups don't hit the disk."""
+        found = {}
+        for entry in os.listdir(self.icon_dir):
+            stem, ext = os.path.splitext(entry)
+            if ext in self.EXTENSIONS:
+                found.setdefault(stem, []).append(ext)
+        
+        # Keep the most preferred extension for each icon name
+        self._disk_index = {
+            stem: os.path.join(self.icon_dir, stem + min(exts, key=self.EXTENSIONS.index))
+            for stem, exts in found.items()
+        }
+        self.icon_cache.clear()
     
     def get_icon(self, name):
         """
@@ -40,30 +64,23 @@ class IconManager:
             QIcon object
         """
         # Check cache first
-        if name in self.icon_cache:
-            return self.icon_cache[name]
-        
-        # Try to load icon
-        icon = self._load_icon(name)
-        
-        # Cache it
-        self.icon_cache[name] = icon
-        
+        icon = self.icon_cache.get(name)
+        if icon is None:
+            # Load on first use and cache it
+            icon = self.icon_cache[name] = self._load_icon(name)
         return icon
     
     def _load_icon(self, name):
         """Load icon from file."""
-        # Try different file extensions
-        extensions = ['.svg', '.png', '.jpg', '.ico']
-        
-        for ext in extensions:
-            icon_path = os.path.join(self.icon_dir, name + ext)
-            if os.path.exists(icon_path):
-                return QIcon(icon_path)
+        icon_path = self._disk_index.get(name)
+        if icon_path:
+            return QIcon(icon_path)
         
-        # Icon not found - return empty icon
-        print(f"Warning: Icon '{name}' not found in {self.icon_dir}")
-        return QIcon()
+        # Icon not found - warn once and return empty icon
+        if name not in self._warned:
+            self._warned.add(name)
+            print(f"Warning: Icon '{name}' not found in {self.icon_dir}")
+        return self._MISSING
     
     def set_icon_size(self, size):
         """Set default icon size."""
@@ -1,8 +1,13 @@
 """Find and Replace dialog functionality."""
 
+import bisect
+import re
 from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QCheckBox, QMessageBox
 from PyQt5.QtGui import QTextDocument, QTextCursor
 
+# Characters outside the Basic Multilingual Plane, which Qt stores as two UTF-16 units
+ASTRAL_CHAR = re.compile('[\U00010000-\U0010FFFF]')
+
 
 class FindReplaceDialog(QDialog):
     """Dialog for finding and replacing text."""
@@ -12,7 +17,16 @@ class FindReplaceDialog(QDialog):
         self.parent = parent
         self.setWindowTitle('Find and Replace')
         self.setModal(False)
-        self.init_ui()
+        self._built = False
+        self._last_failed_query = None
+    
+    def showEvent(self, event):
+        """Build the widgets the first time the dialog is shown."""
+        if not self._built:
+            self.init_ui()
+            self.adjustSize()
+            self._built = True
+        super().showEvent(event)
     
     def init_ui(self):
         """Set up the dialog UI."""
@@ -79,7 +93,7 @@ class FindReplaceDialog(QDialog):
         """Find next occurrence."""
         text = self.find_input.text()
         if text:
-            found = self.parent.text_edit.find(text, self.get_flags())
+            found = self._find(text, self.get_flags())
             if not found:
                 QMessageBox.information(self, 'Find', 'No more matches found.')
     
@@ -88,10 +102,22 @@ class FindReplaceDialog(QDialog):
         text = self.find_input.text()
         if text:
             flags = self.get_flags() | QTextDocument.FindBackward
-            found = self.parent.text_edit.find(text, flags)
+            found = self._find(text, flags)
             if not found:
                 QMessageBox.information(self, 'Find', 'No more matches found.')
     
+    def _find(self, text, flags):
+        """Run a search, skipping the scan if the same search just failed unchanged."""
+        text_edit = self.parent.text_edit
+        query = (text, int(flags), text_edit.document().revision(),
+                 text_edit.textCursor().position())
+        if query == self._last_failed_query:
+            return False
+        
+        found = text_edit.find(text, flags)
+        self._last_failed_query = None if found else query
+        return found
+    
     def replace(self):
         """Replace current selection."""
         cursor = self.parent.text_edit.textCursor()
@@ -106,20 +132,67 @@ class FindReplaceDialog(QDialog):
         if not find_text:
             return
         
-        cursor = self.parent.text_edit.textCursor()
+        text_edit = self.parent.text_edit
+        document = text_edit.document()
+        cursor = QTextCursor(document)
         cursor.beginEditBlock()
         
-        cursor.movePosition(QTextCursor.Start)
-        self.parent.text_edit.setTextCursor(cursor)
-        
-        count = 0
-        while self.parent.text_edit.find(find_text, self.get_flags()):
-            cursor = self.parent.text_edit.textCursor()
-            cursor.insertText(replace_text)
-            count += 1
+        spans = self._find_spans(self.parent.plain_text(), find_text)
+        count = self._replace_spans(document, spans, replace_text)
         
         cursor.endEditBlock()
+        text_edit.setTextCursor(cursor)
+        
         QMessageBox.information(
             self, 'Replace All',
             f'Replaced {count} occurrence(s).'
         )
+    
+    def _find_spans(self, text, find_text):
+        """
+        Locate every match of find_text in the document's plain text.
+        
+        Exact searches use str.find; the other option combinations use a
+        single regex scan whose word boundaries mirror Qt's (letters and
+        digits only).
+        
+        Returns:
+            (start, end) document positions, in UTF-16 units like QTextCursor
+        """
+        if self.case_sensitive.isChecked() and not self.whole_word.isChecked():
+            spans = []
+            pos = text.find(find_text)
+            while pos >= 0:
+                spans.append((pos, pos + len(find_text)))
+                pos = text.find(find_text, pos + len(find_text))
+            return self._document_spans(text, spans)
+        
+        pattern = re.escape(find_text)
+        if self.whole_word.isChecked():
+            pattern = r'(?<![^\W_])' + pattern + r'(?![^\W_])'
+        flags = 0 if self.case_sensitive.isChecked() else re.IGNORECASE
+        spans = [match.span() for match in re.finditer(pattern, text, flags)]
+        return self._document_spans(text, spans)
+    
+    def _document_spans(self, text, spans):
+        """
+        Convert code-point spans in text to document positions.
+        
+        Python indexes strings by code point, but Qt counts UTF-16 units,
+        so each astral character (e.g. an emoji) before a span shifts it
+        by one position.
+        """
+        astral = [match.start() for match in ASTRAL_CHAR.finditer(text)]
+        if not astral:
+            return spans
+        return [(start + bisect.bisect_left(astral, start),
+                 end + bisect.bisect_left(astral, end)) for start, end in spans]
+    
+    def _replace_spans(self, document, spans, replace_text):
+        """Replace spans back to front so earlier offsets stay valid and formatting is kept."""
+        cursor = QTextCursor(document)
+        for start, end in reversed(spans):
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            cursor.insertText(replace_text)
+        return len(spans)
@@ -2,9 +2,9 @@
 
 from PyQt5.QtWidgets import (QDockWidget, QWidget, QVBoxLayout, QHBoxLayout,
                              QCheckBox, QListWidget, QListWidgetItem, QPushButton,
-                             QLabel, QLineEdit)
-from PyQt5.QtGui import QColor, QTextCursor, QTextCharFormat
-from PyQt5.QtCore import Qt, pyqtSignal
+                             QLabel, QLineEdit, QTextEdit)
+from PyQt5.QtGui import QColor, QTextCharFormat, QTextCursor
+from PyQt5.QtCore import Qt, QPoint, pyqtSignal
 
 
 class WritingCheckerDock(QDockWidget):
@@ -270,8 +270,15 @@ class WritingCheckerDock(QDockWidget):
         self.selection_readability.setText(analysis_text)
 
 
+def _background_format(color):
+    """Create a character format with the given background color."""
+    fmt = QTextCharFormat()
+    fmt.setBackground(color)
+    return fmt
+
+
 class WritingHighlighter:
-    """Applies highlighting to text for writing issues."""
+    """Applies highlighting to an editor's text for writing issues."""
     
     COLOR_MAP = {
         'passive_voice': QColor(255, 200, 0, 100),
@@ -285,28 +292,68 @@ class WritingHighlighter:
         'cinnamon_words': QColor(255, 200, 200, 100)
     }
     
-    @staticmethod
-    def highlight_issues(text_edit, issues):
-        """Apply highlighting to text editor for all issues."""
-        cursor = text_edit.textCursor()
-        cursor.movePosition(QTextCursor.Start)
-        text_edit.setTextCursor(cursor)
-        
-        # Clear previous highlighting
-        fmt = QTextCharFormat()
-        cursor.select(QTextCursor.Document)
-        cursor.setCharFormat(fmt)
-        
-        # Apply new highlighting
-        for issue in issues:
-            cursor.setPosition(issue.start)
-            cursor.movePosition(QTextCursor.Right, QTextCursor.KeepAnchor, issue.end - issue.start)
-            
-            fmt = QTextCharFormat()
-            fmt.setBackground(WritingHighlighter.COLOR_MAP.get(
+    # One background format per issue type, copied for each issue's tooltip
+    FORMATS = {issue_type: _background_format(color) for issue_type, color in COLOR_MAP.items()}
+    DEFAULT_FORMAT = _background_format(QColor(200, 200, 200, 100))
+    
+    def __init__(self, text_edit):
+        self.text_edit = text_edit
+        # Issues to show, and the document revision their positions belong to
+        self._issues = []
+        self._revision = None
+        # Revision and visible issues last painted, to skip identical repaints
+        self._painted_key = None
+    
+    def highlight_issues(self, issues):
+        """Apply highlighting to the editor for all issues."""
+        self._issues = issues
+        self._revision = self.text_edit.document().revision()
+        self.paint_visible()
+    
+    def paint_visible(self):
+        """
+        Show the pending issues that are currently on screen.
+        
+        Highlights are the editor's extra selections, a layer drawn over
+        the text rather than formatting stored in the document, so they
+        never touch the undo history or the modified flag. The layer is
+        replaced in a single call, and left alone when the visible issues
+        have not changed. Off-screen issues are shown when they are
+        scrolled into view.
+        """
+        text_edit = self.text_edit
+        document = text_edit.document()
+        
+        # Pending positions are stale once the text is edited; wait for the next check
+        if document.revision() != self._revision:
+            return
+        
+        viewport = text_edit.viewport()
+        first_visible = text_edit.cursorForPosition(QPoint(0, 0)).position()
+        last_visible = text_edit.cursorForPosition(
+            QPoint(viewport.width(), viewport.height())
+        ).position()
+        
+        visible = [issue for issue in self._issues
+                   if issue.end >= first_visible and issue.start <= last_visible]
+        key = (document.revision(), [
+            (issue.start, issue.end, issue.issue_type, issue.suggestion) for issue in visible
+        ])
+        if key == self._painted_key:
+            return
+        
+        selections = []
+        for issue in visible:
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = QTextCursor(document)
+            selection.cursor.setPosition(issue.start)
+            selection.cursor.setPosition(issue.end, QTextCursor.KeepAnchor)
+            selection.format = QTextCharFormat(self.FORMATS.get(
                 issue.issue_type,
-                QColor(200, 200, 200, 100)
+                self.DEFAULT_FORMAT
             ))
-            fmt.setToolTip(f"{issue.issue_type}: {issue.suggestion}")
-            
-            cursor.setCharFormat(fmt)
\ No newline at end of file
+            selection.format.setToolTip(f"{issue.issue_type}: {issue.suggestion}")
+            selections.append(selection)
+        
+        text_edit.setExtraSelections(selections)
+        self._painted_key = key
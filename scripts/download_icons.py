@@ -8,6 +8,7 @@ import os
 import urllib.request
 import urllib.error
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Base URL for Material Design Icons SVG files
 MDI_BASE_URL = "https://raw.githubusercontent.com/Templarian/MaterialDesign/master/svg/"
@@ -28,6 +29,9 @@ ICONS = {
     'format-list-numbered': 'format-list-numbered',
 }
 
+# Downloads run at once; each one mostly waits on the network
+MAX_WORKERS = 8
+
 
 def get_icons_directory():
     """Get the path to the icons directory."""
@@ -55,16 +59,24 @@ def download_icon(icon_name, output_dir):
     url = f"{MDI_BASE_URL}{icon_name}.svg"
     output_path = os.path.join(output_dir, f"{icon_name}.svg")
     
+    # Icons from an earlier run are kept; delete one to fetch it again
+    if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+        print(f"  Skipping {icon_name}.svg (already downloaded)")
+        return True
+    
+    # Each result is printed as one line, since downloads run in parallel
     try:
-        print(f"  Downloading {icon_name}.svg... ", end="", flush=True)
-        urllib.request.urlretrieve(url, output_path)
-        print("✓")
+        # Download beside the icon first, so a failed download never looks complete
+        partial_path = output_path + '.part'
+        urllib.request.urlretrieve(url, partial_path)
+        os.replace(partial_path, output_path)
+        print(f"  Downloading {icon_name}.svg... ✓")
         return True
     except urllib.error.HTTPError as e:
-        print(f"✗ (HTTP {e.code})")
+        print(f"  Downloading {icon_name}.svg... ✗ (HTTP {e.code})")
         return False
     except Exception as e:
-        print(f"✗ ({e})")
+        print(f"  Downloading {icon_name}.svg... ✗ ({e})")
         return False
 
 
@@ -95,8 +107,14 @@ def main():
     failed_count = 0
     failed_icons = []
     
-    for icon_name in ICONS.values():
-        if download_icon(icon_name, icons_dir):
+    icon_names = list(ICONS.values())
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(
+            lambda icon_name: download_icon(icon_name, icons_dir), icon_names
+        ))
+    
+    for icon_name, downloaded in zip(icon_names, results):
+        if downloaded:
             success_count += 1
         else:
             failed_count += 1
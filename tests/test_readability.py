@@ -0,0 +1,73 @@
+"""Tests for readability analysis."""
+
+import unittest
+
+from keep_me_honest.core.readability import ReadabilityAnalyzer
+
+
+class BlockCountsTest(unittest.TestCase):
+    """Readability combined from per-block counts must match analyzing the whole text."""
+    
+    def setUp(self):
+        self.analyzer = ReadabilityAnalyzer()
+    
+    def assertBlocksMatchWholeText(self, text):
+        """Check analyze_blocks() over the text's lines against analyze() on the text."""
+        counts = [self.analyzer.block_counts(block) for block in text.split('\n')]
+        self.assertEqual(self.analyzer.analyze_blocks(counts), self.analyzer.analyze(text))
+    
+    def test_single_block(self):
+        self.assertBlocksMatchWholeText("The cat sat on the mat. It was happy!")
+    
+    def test_blank_lines(self):
+        self.assertBlocksMatchWholeText("First sentence here.\n\n\nSecond one follows.\n")
+        self.assertBlocksMatchWholeText("\n\n")
+    
+    def test_whitespace_only_blocks(self):
+        self.assertBlocksMatchWholeText("One sentence.\n   \n\t\nAnother sentence.")
+    
+    def test_blocks_without_terminators(self):
+        # An unterminated block runs on into the next one as a single sentence
+        self.assertBlocksMatchWholeText("A heading\nwith no full stop\nends here.")
+        self.assertBlocksMatchWholeText("Just a list\nof items\nand nothing else")
+    
+    def test_trailing_ellipsis(self):
+        self.assertBlocksMatchWholeText("Wait for it...\nThere it is...")
+        self.assertBlocksMatchWholeText("So...\n...and then?!\nNothing...")
+    
+    def test_terminators_only(self):
+        self.assertBlocksMatchWholeText("...\n!?\nWords at last.")
+    
+    def test_sentence_split_across_blocks(self):
+        analysis = self.analyzer.analyze_blocks([
+            self.analyzer.block_counts("This sentence starts here"),
+            self.analyzer.block_counts("and ends here. A second one."),
+        ])
+        self.assertEqual(analysis['sentences'], 2)
+    
+    def test_empty(self):
+        self.assertEqual(self.analyzer.analyze_blocks([]), self.analyzer.analyze(""))
+        self.assertEqual(self.analyzer.analyze("")['words'], 0)
+
+
+class AverageWordLengthTest(unittest.TestCase):
+    """avg_word_length is characters per word, not counting whitespace."""
+    
+    def setUp(self):
+        self.analyzer = ReadabilityAnalyzer()
+    
+    def test_characters_per_word(self):
+        analysis = self.analyzer.analyze("Cats eat fish.")
+        self.assertEqual(analysis['avg_word_length'], 4.0)  # 12 characters in 3 words
+    
+    def test_whitespace_is_not_counted(self):
+        spaced = self.analyzer.analyze("Cats   eat\t\tfish.")
+        self.assertEqual(spaced['avg_word_length'], 4.0)  # 12 characters in 3 words
+    
+    def test_combined_across_blocks(self):
+        counts = [self.analyzer.block_counts("Hi there."), self.analyzer.block_counts("Bye.")]
+        self.assertEqual(self.analyzer.analyze_blocks(counts)['avg_word_length'], 4.0)  # 12 characters in 3 words
+
+
+if __name__ == '__main__':
+    unittest.main()
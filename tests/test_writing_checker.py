@@ -0,0 +1,37 @@
+"""Tests for the writing checker."""
+
+import unittest
+
+from keep_me_honest.core.writing_checker import WritingChecker
+
+
+class RepeatedWordsTest(unittest.TestCase):
+    """Repeated words are reported over the span of both occurrences."""
+    
+    def setUp(self):
+        self.checker = WritingChecker()
+    
+    def repeated(self, text):
+        return [(issue.start, issue.end, issue.text)
+                for issue in self.checker._check_repeated_words(text)]
+    
+    def test_position_of_repeat(self):
+        self.assertEqual(self.repeated("I saw the the cat"), [(6, 13, "the the")])
+    
+    def test_later_occurrence_is_reported_where_it_is(self):
+        # The first "the" is not repeated; the report covers the later pair
+        text = "the dog and the the cat"
+        self.assertEqual(self.repeated(text), [(12, 19, "the the")])
+    
+    def test_case_insensitive_and_spacing_kept(self):
+        self.assertEqual(self.repeated("The  the end"), [(0, 8, "The  the")])
+    
+    def test_every_repeat_in_a_run(self):
+        self.assertEqual(self.repeated("go go go"), [(0, 5, "go go"), (3, 8, "go go")])
+    
+    def test_no_repeats(self):
+        self.assertEqual(self.repeated("one two three"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()